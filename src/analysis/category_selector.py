@@ -1,46 +1,70 @@
 from __future__ import annotations
 
+import sys
 from collections import defaultdict
 from typing import Dict, Iterable, List, Tuple
 
 from ..models import Article
 from .prioritize import PrioritizedItem, prioritize_articles
-from .quota_redistributor import redistribute_shortfalls
 
-CATEGORIES = ["Agile", "DevOps", "Architecture/Infra", "Leadership"]
+# Interned explicitly: "Architecture/Infra" is not identifier-like, so the compiler
+# leaves it un-interned. Lookups against the interned names that classify_text
+# and MonthlyArchive hand out then match on identity.
+CATEGORIES = [sys.intern(c) for c in ("Agile", "DevOps", "Architecture/Infra", "Leadership")]
 
 
-def select_top_per_category(
-    articles: Iterable[Article], *, per_category: int = 16, horizon_weeks: int = 4
-) -> Dict[str, List[PrioritizedItem]]:
-    # Score globally then filter per-category for determinism
-    scored: List[PrioritizedItem] = prioritize_articles(articles, horizon_weeks=horizon_weeks, top_n=1000)
+def _bucket_by_category(scored: Iterable[PrioritizedItem]) -> Dict[str, List[PrioritizedItem]]:
     buckets: Dict[str, List[PrioritizedItem]] = defaultdict(list)
     for it in scored:
         cat = it.article.category or "Uncategorized"
         buckets[cat].append(it)
+    return buckets
+
 
+def _take_per_category(
+    scored: Iterable[PrioritizedItem], per_category: int
+) -> Dict[str, List[PrioritizedItem]]:
+    """First ``per_category`` items of each known category, in input order.
+
+    Items of other categories are skipped rather than bucketed, and the scan
+    stops once every known category is full.
+    """
     selected: Dict[str, List[PrioritizedItem]] = {c: [] for c in CATEGORIES}
-    for cat in CATEGORIES:
-        pool = buckets.get(cat, [])
-        selected[cat] = pool[:per_category]
+    if per_category <= 0:
+        return selected
+    open_slots = len(selected)
+    for it in scored:
+        pool = selected.get(it.article.category or "Uncategorized")
+        if pool is None or len(pool) >= per_category:
+            continue
+        pool.append(it)
+        if len(pool) == per_category:
+            open_slots -= 1
+            if not open_slots:
+                break
     return selected
 
 
+def select_top_per_category(
+    articles: Iterable[Article], *, per_category: int = 16, horizon_weeks: int = 4
+) -> Dict[str, List[PrioritizedItem]]:
+    # Score globally then filter per-category for determinism
+    scored: List[PrioritizedItem] = prioritize_articles(articles, horizon_weeks=horizon_weeks, top_n=1000)
+    return _take_per_category(scored, per_category)
+
+
 def score_and_bucket(
     articles: Iterable[Article], *, horizon_weeks: int = 4, top_n: int = 2000
 ) -> Dict[str, List[PrioritizedItem]]:
     scored: List[PrioritizedItem] = prioritize_articles(articles, horizon_weeks=horizon_weeks, top_n=top_n)
-    buckets: Dict[str, List[PrioritizedItem]] = defaultdict(list)
-    for it in scored:
-        cat = it.article.category or "Uncategorized"
-        buckets[cat].append(it)
-    return buckets
+    return _bucket_by_category(scored)
 
 
 def select_with_redistribution(
     articles: Iterable[Article], *, per_category: int = 16, total: int = 64, horizon_weeks: int = 4
 ) -> Dict[str, List[PrioritizedItem]]:
+    from .quota_redistributor import redistribute_shortfalls  # local import to avoid circular import
+
     buckets = score_and_bucket(articles, horizon_weeks=horizon_weeks)
     selected: Dict[str, List[PrioritizedItem]] = {c: [] for c in CATEGORIES}
     for cat in CATEGORIES:
@@ -1,12 +1,33 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
-import json
+import struct
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Iterable, List, Optional, Set, Tuple
 
 from ..models import Article
+from ..utils import jsonio
+from ..utils.logging import get_logger
+
+logger = get_logger("ja.analysis.duplicates")
+
+# Identifier digest: BLAKE2b truncated to 128 bits is ample for a local dedupe
+# cache and much cheaper than SHA-256 on short strings. The tag is persisted
+# with the store so files written with another algorithm are discarded.
+_HASH_ALGO = "blake2b-128"
+_DIGEST_SIZE = 16
+
+# Bloom sidecar: lets startup answer "never seen" without parsing the history.
+# Header = magic + byte size of the history it covers; then the bit array.
+# 2**20 bits with 7 probes stays near 1% false positives up to ~100k digests.
+_BLOOM_MAGIC = b"DTB2"  # bump when _HASH_ALGO or the probe scheme changes
+_BLOOM_HEADER = struct.Struct("<4sQ")
+_BLOOM_BITS = 1 << 20
+_BLOOM_PROBES = 7
+# Keeps title and URL digests apart in the shared bit array
+_URL_SALT = 0x9E3779B97F4A7C15
 
 
 @dataclass(slots=True)
@@ -20,59 +41,215 @@ class DuplicateTracker:
     """File-backed tracker to prevent duplicate issue creation.
 
     Stores minimal identifiers: title hash and URL hashes for articles included
-    in an issue.
+    in an issue. The store is append-only JSON Lines: a header line carrying
+    the hash algorithm followed by one record per line. New records are
+    buffered and appended on ``flush()`` (also run at interpreter exit).
+
+    A Bloom filter sidecar (``<store>.bloom``) is kept in step with the store.
+    When it is current, the history itself is only parsed once a lookup hits
+    the filter, so runs that see only new articles skip the parse entirely.
     """
 
-    def __init__(self, *, store_path: Path | str = ".cache/issue-history.json") -> None:
+    def __init__(self, *, store_path: Path | str = ".cache/issue-history.jsonl") -> None:
         self.store_path = Path(store_path)
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
         self._records: List[IssueRecord] = []
-        self._title_index: Set[str] = set()
-        self._url_index: Set[str] = set()
-        self._load()
+        # Indexes hold raw digests; the store keeps their hex form
+        self._title_index: Set[bytes] = set()
+        self._url_index: Set[bytes] = set()
+        self._pending: List[IssueRecord] = []
+        # Rewrite from scratch (header first) when the file is missing or unusable
+        self._needs_header = True
+        self.bloom_path = self.store_path.with_name(self.store_path.name + ".bloom")
+        self._bloom = self._read_bloom()
+        self._loaded = self._bloom is None
+        if self._loaded:
+            self._load()
+            self._rebuild_bloom()
+        else:
+            self._needs_header = False
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _digest(value: str) -> bytes:
+        return hashlib.blake2b(value.encode("utf-8"), digest_size=_DIGEST_SIZE).digest()
 
     @staticmethod
-    def _hash_text(value: str) -> str:
-        return hashlib.sha256(value.encode("utf-8")).hexdigest()
+    def _hash_many(values: Iterable[str]) -> List[bytes]:
+        blake2b = hashlib.blake2b
+        return [blake2b(v.encode("utf-8"), digest_size=_DIGEST_SIZE).digest() for v in values]
+
+    # ---------------- Bloom sidecar -----------------
+    @staticmethod
+    def _probes(digest: bytes, salt: int = 0) -> Iterable[int]:
+        # Double hashing over the two 64-bit halves of the digest
+        h1 = int.from_bytes(digest[:8], "little") ^ salt
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+        return ((h1 + i * h2) % _BLOOM_BITS for i in range(_BLOOM_PROBES))
+
+    def _bloom_add(self, digest: bytes, salt: int = 0) -> None:
+        bits = self._bloom
+        for i in self._probes(digest, salt):
+            bits[i >> 3] |= 1 << (i & 7)
+
+    def _bloom_any(self, digests: Iterable[bytes], salt: int = 0) -> bool:
+        bits = self._bloom
+        return any(
+            all(bits[i >> 3] & (1 << (i & 7)) for i in self._probes(d, salt)) for d in digests
+        )
+
+    def _read_bloom(self) -> Optional[bytearray]:
+        """Return the sidecar's bits if it covers the store exactly, else None."""
+        try:
+            raw = self.bloom_path.read_bytes()
+            size = self.store_path.stat().st_size
+        except OSError:
+            return None
+        if len(raw) != _BLOOM_HEADER.size + _BLOOM_BITS // 8:
+            return None
+        magic, covered = _BLOOM_HEADER.unpack_from(raw)
+        if magic != _BLOOM_MAGIC or covered != size or size == 0:
+            return None
+        return bytearray(raw[_BLOOM_HEADER.size :])
+
+    def _rebuild_bloom(self) -> None:
+        self._bloom = bytearray(_BLOOM_BITS // 8)
+        for h in self._title_index:
+            self._bloom_add(h)
+        for h in self._url_index:
+            self._bloom_add(h, _URL_SALT)
+        self._write_bloom()
+
+    def _write_bloom(self) -> None:
+        if self._needs_header:
+            # Store is missing or unusable: a sidecar must not vouch for it, or
+            # the next start would go lazy and append to the corrupt file
+            try:
+                self.bloom_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return
+        try:
+            size = self.store_path.stat().st_size
+        except OSError:
+            size = 0
+        try:
+            self.bloom_path.write_bytes(_BLOOM_HEADER.pack(_BLOOM_MAGIC, size) + self._bloom)
+        except OSError:
+            pass  # the sidecar is only an accelerator; it is rebuilt on next start
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        # Records made since startup are only in memory; index them after the store
+        pending = list(self._pending)
+        self._records, self._title_index, self._url_index = [], set(), set()
+        self._needs_header = True
+        self._load()
+        for rec in pending:
+            self._index(rec)
+        if self._needs_header:
+            # Store turned out unusable despite a current sidecar; resync it
+            self._rebuild_bloom()
+
+    def _index(self, rec: IssueRecord) -> None:
+        # Decode first so a malformed row leaves the indexes untouched
+        title = bytes.fromhex(rec.title_hash)
+        urls = [bytes.fromhex(h) for h in rec.url_hashes]
+        self._records.append(rec)
+        self._title_index.add(title)
+        self._url_index.update(urls)
 
     def _load(self) -> None:
         if not self.store_path.exists():
             return
         try:
-            data = json.loads(self.store_path.read_text(encoding="utf-8"))
-            for row in data:
-                rec = IssueRecord(
-                    title_hash=row["title_hash"],
-                    url_hashes=tuple(row.get("url_hashes") or ()),
-                    issue_number=row.get("issue_number"),
-                )
-                self._records.append(rec)
-                self._title_index.add(rec.title_hash)
-                self._url_index.update(rec.url_hashes)
+            with self.store_path.open("rb") as f:
+                header = jsonio.loads(next(f, b"null"))
+                # Legacy (untagged SHA-256) or foreign stores fall through to a reset
+                if not isinstance(header, dict) or header.get("hash") != _HASH_ALGO:
+                    raise ValueError(f"Unsupported issue history format: {header!r}")
+                self._needs_header = False
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        row = jsonio.loads(line)
+                        self._index(
+                            IssueRecord(
+                                title_hash=row["title_hash"],
+                                url_hashes=tuple(row.get("url_hashes") or ()),
+                                issue_number=row.get("issue_number"),
+                            )
+                        )
+                    except Exception:  # noqa: BLE001 - e.g. a torn final line
+                        logger.warning("Skipping corrupt issue history row in %s", self.store_path)
         except Exception:
-            # Corrupt or unexpected format; start fresh
+            # Unreadable header or unexpected format; start fresh. flush() moves
+            # the old file aside rather than overwriting it.
+            self._needs_header = True
             self._records = []
             self._title_index = set()
             self._url_index = set()
 
-    def _persist(self) -> None:
-        rows = [asdict(r) for r in self._records]
-        self.store_path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    def flush(self) -> None:
+        """Append buffered records to the store in a single write."""
+        if not self._pending:
+            return
+        lines = [jsonio.dumps(asdict(rec)) + b"\n" for rec in self._pending]
+        if self._needs_header:
+            lines.insert(0, jsonio.dumps({"hash": _HASH_ALGO}) + b"\n")
+            self._set_aside_unusable_store()
+        with self.store_path.open("wb" if self._needs_header else "a+b") as f:
+            if f.tell():
+                # Start on a fresh line if the last append was torn
+                f.seek(-1, 2)
+                if f.read(1) != b"\n":
+                    lines.insert(0, b"\n")
+            f.write(b"".join(lines))
+        self._pending.clear()
+        self._needs_header = False
+        self._write_bloom()
+
+    def _set_aside_unusable_store(self) -> None:
+        """Keep a store that could not be loaded as ``<store>.bak`` instead of truncating it."""
+        try:
+            if self.store_path.stat().st_size == 0:
+                return
+        except OSError:
+            return
+        backup = self.store_path.with_name(self.store_path.name + ".bak")
+        self.store_path.replace(backup)
+        logger.warning("Unusable issue history moved to %s; starting a new one", backup)
 
     def has_seen_articles(self, articles: Iterable[Article]) -> bool:
-        title_hashes = [self._hash_text(a.title) for a in articles]
-        url_hashes = [self._hash_text(a.url) for a in articles]
-        return any(h in self._title_index for h in title_hashes) or any(
-            h in self._url_index for h in url_hashes
+        arts = list(articles)
+        if not self._loaded:
+            title_hashes = self._hash_many(a.title for a in arts)
+            url_hashes = self._hash_many(a.url for a in arts)
+            if not (self._bloom_any(title_hashes) or self._bloom_any(url_hashes, _URL_SALT)):
+                return False
+            self._ensure_loaded()
+            return not self._title_index.isdisjoint(title_hashes) or not (
+                self._url_index.isdisjoint(url_hashes)
+            )
+        if self._title_index and not self._title_index.isdisjoint(
+            self._hash_many(a.title for a in arts)
+        ):
+            return True
+        return bool(self._url_index) and not self._url_index.isdisjoint(
+            self._hash_many(a.url for a in arts)
         )
 
     def record_issue(self, *, title: str, articles: Iterable[Article], issue_number: Optional[int]) -> None:
         rec = IssueRecord(
-            title_hash=self._hash_text(title),
-            url_hashes=tuple(self._hash_text(a.url) for a in articles),
+            title_hash=self._digest(title).hex(),
+            url_hashes=tuple(h.hex() for h in self._hash_many(a.url for a in articles)),
             issue_number=issue_number,
         )
-        self._records.append(rec)
-        self._title_index.add(rec.title_hash)
-        self._url_index.update(rec.url_hashes)
-        self._persist()
+        self._index(rec)
+        self._pending.append(rec)
+        self._bloom_add(bytes.fromhex(rec.title_hash))
+        for h in rec.url_hashes:
+            self._bloom_add(bytes.fromhex(h), _URL_SALT)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
 from dataclasses import asdict
 from datetime import datetime, timezone
+import os
+import sys
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from ..models import Article
+from ..utils import jsonio
 from ..utils.logging import get_logger
 
 
@@ -14,10 +16,12 @@ logger = get_logger("ja.analysis.archive")
 
 
 class MonthlyArchive:
-    """JSON file-backed storage for processed articles grouped by month.
+    """JSON Lines file-backed storage for processed articles grouped by month.
 
-    Files are stored under base_dir/YYYY-MM.json. Writes are idempotent and
-    merge new articles by URL.
+    Files are stored under base_dir/YYYY-MM.jsonl with one article per line.
+    Writes only append; on read the last row for a URL wins, and files are
+    compacted once superseded rows outnumber live ones. Legacy YYYY-MM.json
+    archives are still read and are folded in on the next write.
     """
 
     def __init__(self, base_dir: str | Path = "data/archive") -> None:
@@ -29,6 +33,9 @@ class MonthlyArchive:
         return f"{dt.year:04d}-{dt.month:02d}"
 
     def _file_for_month(self, month_slug: str) -> Path:
+        return self.base_dir / f"{month_slug}.jsonl"
+
+    def _legacy_file_for_month(self, month_slug: str) -> Path:
         return self.base_dir / f"{month_slug}.json"
 
     @staticmethod
@@ -48,59 +55,101 @@ class MonthlyArchive:
 
     @staticmethod
     def _dict_to_article(d: dict) -> Article:
+        # Source and category names repeat across every row; intern them so the
+        # scoring/bucketing dict lookups hit identity comparisons
+        category = d.get("category")
         return Article(
             title=d.get("title") or "",
             url=d.get("url") or "",
-            source=d.get("source") or "",
+            source=sys.intern(d.get("source") or ""),
             raw_text=d.get("raw_text") or "",
             published_date=d.get("published_date"),
-            category=d.get("category"),
+            category=sys.intern(category) if category else category,
             summary=d.get("summary"),
             confidence_score=d.get("confidence_score"),
         )
 
+    def _read_legacy_rows(self, file_path: Path) -> List[dict]:
+        try:
+            data = jsonio.loads(file_path.read_bytes())
+            rows = data.get("articles", [])
+            return [row for row in rows if isinstance(row, dict) and row.get("url")]
+        except Exception:  # noqa: BLE001
+            logger.warning("Legacy archive file corrupted; ignoring: %s", file_path)
+            return []
+
+    def _read_rows(self, month_slug: str) -> Tuple[dict[str, dict], int]:
+        """Return live rows keyed by URL (last write wins) and the number of rows read."""
+        file_path = self._file_for_month(month_slug)
+        if not file_path.exists():
+            legacy_path = self._legacy_file_for_month(month_slug)
+            rows = self._read_legacy_rows(legacy_path) if legacy_path.exists() else []
+            return {row["url"]: row for row in rows}, len(rows)
+
+        live: dict[str, dict] = {}
+        total = 0
+        with file_path.open("rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    row = jsonio.loads(line)
+                except Exception:  # noqa: BLE001 - e.g. a torn final line
+                    logger.warning("Skipping corrupt archive row in %s", file_path)
+                    continue
+                if isinstance(row, dict):
+                    live[row.get("url") or ""] = row
+                    total += 1
+        return live, total
+
+    def _compact(self, month_slug: str, rows: Iterable[dict]) -> None:
+        file_path = self._file_for_month(month_slug)
+        tmp_path = file_path.with_suffix(".jsonl.tmp")
+        tmp_path.write_bytes(b"".join(jsonio.dumps(row) + b"\n" for row in rows))
+        os.replace(tmp_path, file_path)
+        logger.info("Compacted archive %s", file_path)
+
     def store_articles(self, articles: Iterable[Article], *, month_slug: Optional[str] = None) -> Path:
-        """Merge and store articles for the given month (defaults to current)."""
+        """Append articles for the given month (defaults to current)."""
         slug = month_slug or self._month_slug()
         file_path = self._file_for_month(slug)
 
-        existing: dict[str, dict] = {}
-        if file_path.exists():
-            try:
-                data = json.loads(file_path.read_text(encoding="utf-8"))
-                for row in data.get("articles", []):
-                    if isinstance(row, dict):
-                        url = row.get("url")
-                        if url:
-                            existing[url] = row
-            except Exception:  # noqa: BLE001
-                logger.warning("Archive file corrupted; recreating: %s", file_path)
-                existing = {}
-
+        rows: List[dict] = []
+        legacy_path = self._legacy_file_for_month(slug)
+        if not file_path.exists() and legacy_path.exists():
+            # Seed the new file with the legacy archive so it keeps its contents
+            rows.extend(self._read_legacy_rows(legacy_path))
+        stored = 0
         for art in articles:
-            d = self._article_to_dict(art)
-            existing[d["url"]] = d
-
-        payload = {
-            "month": slug,
-            "count": len(existing),
-            "articles": list(existing.values()),
-        }
-        file_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        logger.info("Stored %d article(s) to %s", len(existing), file_path)
+            rows.append(self._article_to_dict(art))
+            stored += 1
+
+        with file_path.open("a+b") as f:
+            lines = [jsonio.dumps(row) + b"\n" for row in rows]
+            if f.tell():
+                # Start on a fresh line if the last append was torn
+                f.seek(-1, 2)
+                if f.read(1) != b"\n":
+                    lines.insert(0, b"\n")
+            f.write(b"".join(lines))
+        logger.info("Stored %d article(s) to %s", stored, file_path)
         return file_path
 
     def load_monthly_articles(self, *, month_slug: Optional[str] = None) -> List[Article]:
         slug = month_slug or self._month_slug()
-        file_path = self._file_for_month(slug)
-        if not file_path.exists():
-            return []
         try:
-            data = json.loads(file_path.read_text(encoding="utf-8"))
-            return [self._dict_to_article(row) for row in data.get("articles", []) if isinstance(row, dict)]
+            live, total = self._read_rows(slug)
         except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to load archive %s: %s", file_path, exc)
+            logger.warning("Failed to load archive %s: %s", self._file_for_month(slug), exc)
             return []
+        if total - len(live) > len(live) and self._file_for_month(slug).exists():
+            try:
+                self._compact(slug, live.values())
+            except Exception as exc:  # noqa: BLE001 - compaction is best effort
+                logger.warning("Failed to compact archive %s: %s", self._file_for_month(slug), exc)
+        return [self._dict_to_article(row) for row in live.values()]
 
     def list_archives(self) -> List[str]:
-        return sorted(p.stem for p in self.base_dir.glob("*.json"))
+        stems = {p.stem for p in self.base_dir.glob("*.jsonl")}
+        stems.update(p.stem for p in self.base_dir.glob("*.json"))
+        return sorted(stems)
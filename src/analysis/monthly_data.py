@@ -1,22 +1,22 @@
 from __future__ import annotations
 
 import calendar
+import heapq
 import json
+from collections import Counter
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 import os
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
-from github import Github, GithubException
-
 from ..models import Article, Source
 from ..fetchers import fetch_http_entries, fetch_rss_entries
 from ..processors import (
     Deduplicator,
     clean_html_to_text,
-    classify_text,
-    summarize_text,
+    classify_texts,
+    summarize_texts,
 )
 from .prioritize import PrioritizedItem, prioritize_articles
 from ..utils.logging import get_logger
@@ -82,16 +82,17 @@ def _compute_category_counts(items: List[MonthlyItem]) -> Dict[str, int]:
 
 
 def _compute_top_keywords(items: List[MonthlyItem], *, top_k: int = 15) -> List[Tuple[str, int]]:
-    freq: Dict[str, int] = {}
+    freq: Counter[str] = Counter()
     for it in items:
-        for k in _extract_keywords(it.title):
-            freq[k] = freq.get(k, 0) + 1
-    return sorted(freq.items(), key=lambda kv: (-kv[1], kv[0]))[:top_k]
+        freq.update(_extract_keywords(it.title))
+    # nsmallest keeps the alphabetical tie-break that most_common() would lose
+    return heapq.nsmallest(top_k, freq.items(), key=lambda kv: (-kv[1], kv[0]))
 
 
 def collect_processed_articles(sources: Iterable[Source], *, fast: bool = False) -> List[Article]:
+    # mark_seen() records each kept title on the deduplicator itself, so no
+    # separate prior_titles list is passed (it would fuzzy-match every title twice)
     dedup = Deduplicator()
-    prior_titles: List[str] = []
     processed: List[Article] = []
 
     for src in sources:
@@ -123,42 +124,36 @@ def collect_processed_articles(sources: Iterable[Source], *, fast: bool = False)
                 logger.warning("Unknown source type: %s", src.type)
                 continue
 
+            kept: List[Article] = []
             for art in fetched:
                 # Normalize
                 art.raw_text = clean_html_to_text(art.raw_text)
 
                 # Dedup
-                is_dup, _ = dedup.is_duplicate(art, prior_titles=prior_titles)
+                is_dup, _ = dedup.is_duplicate(art)
                 if is_dup:
                     continue
                 dedup.mark_seen(art)
-                prior_titles.append(art.title)
+                kept.append(art)
 
-                # Classify
-                if fast:
+            if fast:
+                for art in kept:
                     art.category = art.category or "Architecture/Infra"
                     art.confidence_score = 0.0
-                else:
-                    try:
-                        category, conf = classify_text(art.raw_text)
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning("Classification failed: %s; defaulting", exc)
-                        category, conf = "Architecture/Infra", 0.0
+                    words = art.raw_text.split()
+                    art.summary = " ".join(words[:60]) + ("..." if len(words) > 60 else "")
+            elif kept:
+                # Classify and summarize the source's articles as one batch each,
+                # with the backend calls overlapped
+                texts = [art.raw_text for art in kept]
+                categories = classify_texts(texts, default=("Architecture/Infra", 0.0))
+                summaries = summarize_texts(texts, default="(summary pending)")
+                for art, (category, conf), summary in zip(kept, categories, summaries):
                     art.category = category
                     art.confidence_score = conf
+                    art.summary = summary
 
-                # Summarize
-                if fast:
-                    words = art.raw_text.split()
-                    art.summary = " ".join(words[:60]) + ("..." if len(words) > 60 else "")
-                else:
-                    try:
-                        art.summary = summarize_text(art.raw_text)
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning("Summarization failed: %s; pending", exc)
-                        art.summary = "(summary pending)"
-
-                processed.append(art)
+            processed.extend(kept)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Failed processing source %s: %s", src.name, exc)
     return processed
@@ -218,6 +213,9 @@ def write_monthly_data_to_repo(
     if not repo_name:
         raise RuntimeError("Target repository is not configured (MONTHLY_DATA_REPOSITORY/DATA_REPOSITORY/GITHUB_REPOSITORY)")
 
+    # Lazy import: PyGithub takes ~0.2s to import and only the data-repo helpers use it
+    from github import Github, GithubException
+
     gh = Github(token)
     repo = gh.get_repo(repo_name)
     if branch is None:
@@ -271,6 +269,8 @@ def monthly_data_exists(
         logger.warning("No target repository configured for monthly data existence check")
         return False
 
+    from github import Github, GithubException  # lazy import
+
     gh = Github(token)
     repo = gh.get_repo(repo_name)
     if branch is None:
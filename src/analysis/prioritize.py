@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import calendar
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple
 from collections import Counter
 
 from ..models import Article
 
+# Optional heavy deps are imported lazily
+try:  # pragma: no cover - optional dependency
+    import numpy as _np  # type: ignore
+except Exception:  # pragma: no cover - env without numpy
+    _np = None  # type: ignore
+
 
 @dataclass(slots=True)
 class PrioritizedItem:
@@ -17,30 +24,54 @@ class PrioritizedItem:
     rationale: str
 
 
+# Basic heuristic; could be extended/configured
+_SOURCE_AUTHORITY = {
+    "ThoughtWorks Technology Radar": 1.0,
+    "Martin Fowler Blog": 0.9,
+    "DORA DevOps Blog": 0.85,
+}
+_DEFAULT_AUTHORITY = 0.6
+
+# Light preference to diversify
+_CATEGORY_WEIGHTS = {
+    "Agile": 0.9,
+    "DevOps": 0.95,
+    "Architecture/Infra": 1.0,
+    "Leadership": 0.9,
+}
+_DEFAULT_CATEGORY_WEIGHT = 0.8
+_UNCATEGORIZED_WEIGHT = 0.6
+
+
 def _source_authority(source_name: str) -> float:
-    # Basic heuristic; could be extended/configured
-    ranked = {
-        "ThoughtWorks Technology Radar": 1.0,
-        "Martin Fowler Blog": 0.9,
-        "DORA DevOps Blog": 0.85,
-    }
-    return ranked.get(source_name, 0.6)
+    return _SOURCE_AUTHORITY.get(source_name, _DEFAULT_AUTHORITY)
 
 
-def _recency_boost(published_iso: str | None, *, horizon_days: int) -> float:
-    if not published_iso:
-        return 0.5
+@lru_cache(maxsize=4096)
+def _parse_published(published_iso: str) -> Optional[datetime]:
+    """Parse an ISO timestamp as aware UTC; cached since the same dates recur across scoring passes."""
     try:
         dt = datetime.fromisoformat(published_iso)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
     except Exception:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _recency_boost(
+    published_iso: str | None, *, horizon_days: int, now: Optional[datetime] = None
+) -> float:
+    if not published_iso:
+        return 0.5
+    dt = _parse_published(published_iso)
+    if dt is None:
         return 0.5
-    age_days = max(0, (datetime.now(timezone.utc) - dt).days)
+    age_days = max(0, ((now or datetime.now(timezone.utc)) - dt).days)
     if age_days >= horizon_days:
         return 0.2
-    # Linear decay within horizon
-    return 1.0 - (age_days / horizon_days) * 0.8  # min 0.2 within horizon
+    # Linear decay within horizon; same product form as the vectorized path
+    return 1.0 - age_days * (0.8 / horizon_days)  # min 0.2 within horizon
 
 
 def _novelty_boost(title: str) -> float:
@@ -51,34 +82,141 @@ def _novelty_boost(title: str) -> float:
 
 def _category_balance_weight(category: str | None) -> float:
     if not category:
-        return 0.6
-    # Light preference to diversify
-    base = {
-        "Agile": 0.9,
-        "DevOps": 0.95,
-        "Architecture/Infra": 1.0,
-        "Leadership": 0.9,
-    }.get(category, 0.8)
-    return base
+        return _UNCATEGORIZED_WEIGHT
+    return _CATEGORY_WEIGHTS.get(category, _DEFAULT_CATEGORY_WEIGHT)
 
 
-def prioritize_articles(
-    articles: Iterable[Article], *, horizon_weeks: int = 4, top_n: int = 10
+def _age_days(published_iso: str | None, now: datetime) -> float:
+    """Age in whole days, or NaN when the date is missing or unparsable."""
+    if not published_iso:
+        return float("nan")
+    dt = _parse_published(published_iso)
+    if dt is None:
+        return float("nan")
+    return float(max(0, (now - dt).days))
+
+
+def _format_rationale(recency: float, authority: float, novelty: float, balance: float) -> str:
+    return f"recency={recency:.2f}, authority={authority:.2f}, novelty={novelty:.2f}, balance={balance:.2f}"
+
+
+def _prioritize_scalar(
+    articles: List[Article], *, horizon_days: int, top_n: int, min_score: Optional[float] = None
 ) -> List[PrioritizedItem]:
-    horizon_days = max(7, horizon_weeks * 7)
-    items: List[PrioritizedItem] = []
+    # Rows are plain tuples: (sort key, article, components); sorting row
+    # indices by key via a C-level getter avoids a Python lambda per item
+    rows: List[Tuple[Tuple[float, str], Article, Tuple[float, float, float, float]]] = []
+    now = datetime.now(timezone.utc)
     for art in articles:
-        recency = _recency_boost(art.published_date, horizon_days=horizon_days)
+        recency = _recency_boost(art.published_date, horizon_days=horizon_days, now=now)
         authority = _source_authority(art.source)
         novelty = _novelty_boost(art.title)
         balance = _category_balance_weight(art.category)
         score = 0.4 * recency + 0.3 * authority + 0.2 * novelty + 0.1 * balance
-        rationale = (
-            f"recency={recency:.2f}, authority={authority:.2f}, novelty={novelty:.2f}, balance={balance:.2f}"
+        if min_score is not None and score < min_score:
+            continue
+        rows.append(((score, art.title.lower()), art, (recency, authority, novelty, balance)))
+    keys = [row[0] for row in rows]
+    order = sorted(range(len(rows)), key=keys.__getitem__, reverse=True)
+    # Rationale strings are only built for the items that are returned
+    return [
+        PrioritizedItem(
+            article=rows[i][1], score=keys[i][0], rationale=_format_rationale(*rows[i][2])
+        )
+        for i in order[:top_n]
+    ]
+
+
+def _score_arrays(ages, authority, word_counts, balance, horizon_days: int):
+    """Vectorized scoring; returns (scores, recency, novelty) arrays.
+
+    Same formulas and operation order as the scalar helpers, so scores match
+    them exactly. Works in place on a few buffers rather than allocating a
+    temporary per operation; ``word_counts`` is overwritten with the novelty.
+    """
+    # Unknown dates score 0.5, linear decay within horizon, 0.2 beyond it
+    # horizon_days is fixed per call: fold the decay into one scalar multiplier
+    recency = _np.multiply(ages, 0.8 / horizon_days)
+    _np.subtract(1.0, recency, out=recency)
+    recency[ages >= horizon_days] = 0.2
+    recency[_np.isnan(ages)] = 0.5
+
+    novelty = word_counts
+    novelty /= 20.0
+    novelty += 0.5
+    _np.minimum(novelty, 1.0, out=novelty)
+
+    scores = _np.multiply(recency, 0.4)
+    scratch = _np.multiply(authority, 0.3)
+    scores += scratch
+    scores += _np.multiply(novelty, 0.2, out=scratch)
+    scores += _np.multiply(balance, 0.1, out=scratch)
+    return scores, recency, novelty
+
+
+def prioritize_articles(
+    articles: Iterable[Article],
+    *,
+    horizon_weeks: int = 4,
+    top_n: int = 10,
+    min_score: Optional[float] = None,
+) -> List[PrioritizedItem]:
+    """Score articles and return the ``top_n`` best, highest first.
+
+    With ``min_score``, items scoring below it are dropped before ranking, so
+    no result objects are built for them. Since results are ordered by score,
+    this equals filtering the unfiltered top ``top_n`` afterwards.
+    """
+    horizon_days = max(7, horizon_weeks * 7)
+    arts = list(articles)
+    if _np is None:
+        return _prioritize_scalar(arts, horizon_days=horizon_days, top_n=top_n, min_score=min_score)
+    n = len(arts)
+    if n == 0:
+        return []
+
+    # Structure-of-arrays: one Python pass to extract features, then array math
+    now = datetime.now(timezone.utc)
+    ages = _np.fromiter((_age_days(a.published_date, now) for a in arts), dtype=_np.float64, count=n)
+    authority_of = _SOURCE_AUTHORITY.get
+    weight_of = _CATEGORY_WEIGHTS.get
+    authority = _np.fromiter(
+        (authority_of(a.source, _DEFAULT_AUTHORITY) for a in arts), dtype=_np.float64, count=n
+    )
+    word_counts = _np.fromiter((len((a.title or "").split()) for a in arts), dtype=_np.float64, count=n)
+    balance = _np.fromiter(
+        (
+            weight_of(a.category, _DEFAULT_CATEGORY_WEIGHT) if a.category else _UNCATEGORIZED_WEIGHT
+            for a in arts
+        ),
+        dtype=_np.float64,
+        count=n,
+    )
+
+    scores, recency, novelty = _score_arrays(ages, authority, word_counts, balance, horizon_days)
+
+    # Top-k selection: partition to the k-th best score in O(N), then only sort the
+    # candidates. Ties at the threshold are kept so the title tie-break stays exact.
+    candidates = _np.arange(n) if min_score is None else _np.flatnonzero(scores >= min_score)
+    if 0 < top_n < candidates.size:
+        pool = scores[candidates]
+        kth = _np.argpartition(-pool, top_n - 1)[top_n - 1]
+        candidates = candidates[pool >= pool[kth]]
+
+    # Order by (score, lowercased title) descending; lexsort is stable like list.sort
+    cand_titles = _np.array([arts[i].title.lower() for i in candidates.tolist()])
+    _, title_rank = _np.unique(cand_titles, return_inverse=True)
+    order = candidates[_np.lexsort((-title_rank, -scores[candidates]))][:top_n]
+
+    # Rationale strings are only built for the items that are returned
+    return [
+        PrioritizedItem(
+            article=arts[i],
+            score=float(scores[i]),
+            rationale=_format_rationale(recency[i], authority[i], novelty[i], balance[i]),
         )
-        items.append(PrioritizedItem(article=art, score=score, rationale=rationale))
-    items.sort(key=lambda x: (x.score, x.article.title.lower()), reverse=True)
-    return items[:top_n]
+        for i in order.tolist()
+    ]
 
 
 def _month_slug(dt: datetime) -> str:
@@ -128,7 +266,7 @@ def write_monthly_analysis_file(
     slug = _month_slug(now)
     file_path = out_path / f"situational-{slug}.md"
     content = generate_monthly_analysis_markdown(items, horizon_weeks=horizon_weeks)
-    file_path.write_text(content, encoding="utf-8")
+    file_path.write_bytes(content.encode("utf-8"))
     return file_path
 
 
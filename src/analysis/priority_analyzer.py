@@ -27,5 +27,7 @@ def filter_high_priority(
         Consider at most this many top-ranked items before filtering
     """
     limit = top_n or 1000
-    prioritized = prioritize_articles(articles, horizon_weeks=horizon_weeks, top_n=limit)
-    return [it for it in prioritized if it.score >= min_score]
+    # The threshold is applied inside the scoring pass, before result objects are built
+    return prioritize_articles(
+        articles, horizon_weeks=horizon_weeks, top_n=limit, min_score=min_score
+    )
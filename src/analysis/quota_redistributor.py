@@ -5,6 +5,25 @@ from typing import Dict, List
 from .prioritize import PrioritizedItem
 from .category_selector import CATEGORIES
 
+# Optional heavy deps are imported lazily
+try:  # pragma: no cover - optional dependency
+    import numpy as _np  # type: ignore
+except Exception:  # pragma: no cover - env without numpy
+    _np = None  # type: ignore
+
+
+def _order_tail(tail: List[PrioritizedItem]) -> List[PrioritizedItem]:
+    """Order by (score, lowercased title) descending, ties keeping input order."""
+    if _np is None or len(tail) < 2:
+        # key= is already decorate-sort-undecorate: lower() runs once per item
+        return sorted(tail, key=lambda it: (it.score, it.article.title.lower()), reverse=True)
+    scores = _np.fromiter((it.score for it in tail), dtype=_np.float64, count=len(tail))
+    _, title_rank = _np.unique(
+        _np.array([it.article.title.lower() for it in tail]), return_inverse=True
+    )
+    # lexsort is stable, matching list.sort(reverse=True) on equal keys
+    return [tail[i] for i in _np.lexsort((-title_rank, -scores)).tolist()]
+
 
 def redistribute_shortfalls(
     *,
@@ -13,34 +32,42 @@ def redistribute_shortfalls(
     target_total: int = 64,
     per_category_limit: int = 16,
 ) -> Dict[str, List[PrioritizedItem]]:
-    result = {c: list(selected.get(c, [])) for c in CATEGORIES}
+    """Top up ``selected`` to ``target_total`` from the best remaining bucket items.
+
+    ``selected`` is never mutated. Lists of categories that receive no extra
+    items are shared with it rather than copied, so treat the result as
+    read-only or copy before modifying.
+    """
+    # Copy-on-write: a category's list is only copied when something is appended
+    result = {c: selected.get(c, []) for c in CATEGORIES}
     current_total = sum(len(v) for v in result.values())
     if current_total >= target_total:
         return result
 
     # Build a global tail pool preserving overall score order
-    global_tail: List[PrioritizedItem] = []
-    for cat in CATEGORIES:
-        pool = buckets.get(cat, [])
-        already = set(id(x) for x in result.get(cat, []))
-        for it in pool:
-            if id(it) not in already:
-                global_tail.append(it)
+    already = {id(x) for lst in result.values() for x in lst}
+    global_tail: List[PrioritizedItem] = [
+        it for cat in CATEGORIES for it in buckets.get(cat, ()) if id(it) not in already
+    ]
 
-    # Sort tail by score desc then title asc to ensure determinism
-    global_tail.sort(key=lambda it: (it.score, it.article.title.lower()), reverse=True)
+    # Sort tail by score desc then title desc to ensure determinism
+    global_tail = _order_tail(global_tail)
 
     # Fill remaining slots while respecting per-category caps
     needed = target_total - current_total
+    room = {c: per_category_limit - len(lst) for c, lst in result.items()}
+    copied: set[str] = set()
     for it in global_tail:
         if needed <= 0:
             break
         cat = it.article.category or "Uncategorized"
-        if cat not in result:
-            continue
-        if len(result[cat]) >= per_category_limit:
+        if room.get(cat, 0) <= 0:
             continue
+        if cat not in copied:
+            result[cat] = list(result[cat])
+            copied.add(cat)
         result[cat].append(it)
+        room[cat] -= 1
         needed -= 1
 
     return result
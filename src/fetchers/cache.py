@@ -0,0 +1,131 @@
+"""Conditional-request cache for fetched feeds and pages.
+
+Stores the validators (``ETag``/``Last-Modified``) and body of the last
+successful response per URL in a small SQLite database, so later runs can
+send ``If-None-Match``/``If-Modified-Since`` and reuse the stored body on a
+``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+
+from ..utils.logging import get_logger
+
+logger = get_logger("ja.fetchers.cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+
+
+class ResponseCache:
+    """SQLite-backed store shared by the fetcher threads of one process."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection per process; fetches run on worker threads, so serialize access
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        return CachedResponse(etag=row[0], last_modified=row[1], body=row[2]) if row else None
+
+    def put(self, url: str, *, etag: Optional[str], last_modified: Optional[str], body: bytes) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, last_modified, body, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, time.time()),
+            )
+            self._conn.commit()
+
+
+_CACHE: Optional[ResponseCache] = None
+_CACHE_LOCK = threading.Lock()
+_CACHE_FAILED = False
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Process-wide cache, opened on first use; None if disabled or unavailable.
+
+    ``HTTP_CACHE_PATH`` overrides the location; setting it to an empty string
+    disables conditional requests.
+    """
+    global _CACHE, _CACHE_FAILED
+    if _CACHE is not None or _CACHE_FAILED:
+        return _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None and not _CACHE_FAILED:
+            path = os.getenv("HTTP_CACHE_PATH", ".cache/http-cache.sqlite3")
+            try:
+                if not path:
+                    raise ValueError("disabled via HTTP_CACHE_PATH")
+                _CACHE = ResponseCache(path)
+            except Exception as exc:  # noqa: BLE001 - caching is best effort
+                logger.debug("HTTP response cache unavailable: %s", exc)
+                _CACHE_FAILED = True
+    return _CACHE
+
+
+def lookup(url: str) -> Optional[CachedResponse]:
+    cache = get_response_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(url)
+    except sqlite3.Error as exc:
+        logger.debug("Response cache lookup failed for %s: %s", url, exc)
+        return None
+
+
+def conditional_headers(cached: Optional[CachedResponse]) -> Dict[str, str]:
+    if cached is None:
+        return {}
+    headers: Dict[str, str] = {}
+    if cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+def store_response(url: str, resp: requests.Response, body: bytes) -> None:
+    """Remember ``body`` for ``url`` if the response carries cache validators."""
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    cache = get_response_cache()
+    if cache is None or not (etag or last_modified):
+        return
+    try:
+        cache.put(url, etag=etag, last_modified=last_modified, body=body)
+    except sqlite3.Error as exc:
+        logger.debug("Failed to cache response for %s: %s", url, exc)
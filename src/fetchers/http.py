@@ -1,15 +1,37 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
-import requests
 from bs4 import BeautifulSoup
 from bs4.element import Comment
 
 from ..models import Source
 from ..utils.logging import get_logger
+from .cache import conditional_headers, lookup, store_response
+from .session import get_session
+
+# Optional C parser backend; BeautifulSoup falls back to the stdlib parser
+try:  # pragma: no cover - optional dependency
+    import lxml.etree as _etree  # type: ignore
+    import lxml.html as _lxml_html  # type: ignore
+
+    _BS4_PARSER = "lxml"
+except Exception:  # pragma: no cover - env without lxml
+    _etree = None  # type: ignore
+    _lxml_html = None  # type: ignore
+    _BS4_PARSER = "html.parser"
+
+# Every node the extractor needs, collected in one document-order pass
+_EXTRACT_XPATH = (
+    _etree.XPath(
+        "(//title)[1] | (//meta[@name='description'])[1]"
+        " | (//main)[1] | (//article)[1] | (//body)[1]"
+    )
+    if _etree is not None
+    else None
+)
 
 logger = get_logger("ja.fetchers.http")
 
@@ -37,19 +59,53 @@ def _validated_url(url: str) -> str:
     return url
 
 
-def fetch_http_entries(source: Source, *, timeout: int = 30) -> List[HTTPItem]:
-    if source.type != "http":
-        raise ValueError("fetch_http_entries requires a source of type 'http'")
+def _parse_html(markup: str, *, url: str) -> HTTPItem:
+    """Extract title, meta description and main text from an HTML page.
 
-    headers = {**_DEFAULT_HEADERS, **(source.headers or {})}
-    url = _validated_url(source.url)
-    logger.debug("Fetching HTTP content from %s", url)
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    if resp.status_code >= 400:
-        logger.warning("HTTP fetch failed (%s): %s", resp.status_code, source.url)
-        resp.raise_for_status()
+    Pure CPU work with no I/O, kept apart from the request so callers can run
+    it wherever parsing is cheapest (fetches already run on worker threads).
+    Uses lxml directly when available and BeautifulSoup otherwise.
+    """
+    if _lxml_html is not None and markup.strip():
+        try:
+            return _parse_html_lxml(markup, url=url)
+        except (ValueError, _etree.ParserError):
+            # e.g. XHTML with an XML encoding declaration; BeautifulSoup copes
+            pass
+    return _parse_html_bs4(markup, url=url)
+
+
+def _parse_html_lxml(markup: str, *, url: str) -> HTTPItem:
+    found: Dict[str, Any] = {}
+    for el in _EXTRACT_XPATH(_lxml_html.fromstring(markup)):
+        found.setdefault(el.tag, el)
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    title_el = found.get("title")
+    title = title_el.text.strip() if title_el is not None and title_el.text else None
+    meta_desc = found.get("meta")
+    desc = meta_desc.get("content") if meta_desc is not None else None
+    description = desc.strip() if desc else None
+
+    # Same preference and cleanup as the BeautifulSoup path
+    main = found.get("main")
+    if main is None:
+        main = found.get("article")
+    if main is None:
+        main = found.get("body")
+    if main is None:
+        content = None
+    else:
+        for tag in list(main.iter("script", "style", "noscript")):
+            # Empty in place: dropping would glue the tail onto the previous text
+            tag.clear(keep_tail=True)
+        # get_text("\n", strip=True) equivalent; map/filter keep the loop in C
+        content = "\n".join(filter(None, map(str.strip, main.itertext())))
+
+    return HTTPItem(title=title, url=url, description=description, content=content)
+
+
+def _parse_html_bs4(markup: str, *, url: str) -> HTTPItem:
+    soup = BeautifulSoup(markup, _BS4_PARSER)
 
     # Very simple heuristic extraction. Real implementation will be more robust.
     title = soup.title.string.strip() if soup.title and soup.title.string else None
@@ -65,5 +121,29 @@ def fetch_http_entries(source: Source, *, timeout: int = 30) -> List[HTTPItem]:
             tag.decompose()
         content = main.get_text("\n", strip=True)
 
+    return HTTPItem(title=title, url=url, description=description, content=content)
+
+
+def fetch_http_entries(source: Source, *, timeout: int = 30) -> List[HTTPItem]:
+    if source.type != "http":
+        raise ValueError("fetch_http_entries requires a source of type 'http'")
+
+    headers = {**_DEFAULT_HEADERS, **(source.headers or {})}
+    url = _validated_url(source.url)
+    logger.debug("Fetching HTTP content from %s", url)
+    cached = lookup(url)
+    resp = get_session().get(url, headers={**headers, **conditional_headers(cached)}, timeout=timeout)
+    if resp.status_code >= 400:
+        logger.warning("HTTP fetch failed (%s): %s", resp.status_code, source.url)
+        resp.raise_for_status()
+
+    if resp.status_code == 304 and cached is not None:
+        logger.debug("HTTP page not modified, reusing cached body: %s", url)
+        markup = cached.body.decode("utf-8")
+    else:
+        # Cache the decoded text so a 304 needs no charset detection
+        markup = resp.text
+        store_response(url, resp, markup.encode("utf-8"))
+    item = _parse_html(markup, url=source.url)
     logger.info("Fetched HTTP page: %s", source.name)
-    return [HTTPItem(title=title, url=source.url, description=description, content=content)]
+    return [item]
@@ -9,6 +9,8 @@ import requests
 
 from ..models import Source
 from ..utils.logging import get_logger
+from .cache import conditional_headers, lookup, store_response
+from .session import get_session
 
 logger = get_logger("ja.fetchers.rss")
 
@@ -43,56 +45,77 @@ def _parse_datetime(entry: dict) -> Optional[datetime]:
     return None
 
 
-def fetch_rss_entries(source: Source, *, timeout: int = 30) -> List[RSSItem]:
+def _first_content(entry) -> Optional[str]:
+    contents = entry.get("content")
+    if contents and isinstance(contents, list):
+        return contents[0].get("value")
+    return None
+
+
+def _parse_feed(data: bytes, source: Source) -> List[RSSItem]:
+    parsed = feedparser.parse(data)
+    if parsed.get("bozo"):
+        # feedparser sets bozo when it encounters a feed error but may still parse entries
+        logger.debug("Feed 'bozo' flagged for %s: %s", source.url, parsed.get("bozo_exception"))
+
+    # One comprehension with locally bound helpers instead of an append loop;
+    # keyword arguments evaluate in order, so ``description`` is bound before use.
+    # FeedParserDict item access skips the __getattr__ fallback that getattr() walks.
+    parse_datetime = _parse_datetime
+    first_content = _first_content
+    return [
+        RSSItem(
+            title=entry.get("title") or "",
+            link=entry.get("link") or "",
+            # Prefer 'summary' but fall back to 'description'
+            description=(
+                description := entry.get("summary") or entry.get("description")
+            ),
+            published=parse_datetime(entry),
+            # content[0].value, falling back to the description
+            content=first_content(entry) or description,
+        )
+        for entry in parsed.get("entries") or ()
+    ]
+
+
+def fetch_rss_entries(
+    source: Source, *, timeout: int = 30, skip_unchanged: bool = False
+) -> List[RSSItem]:
     """Fetch and parse RSS/Atom feed entries with timeouts and basic robustness.
 
     The underlying network request is done with ``requests`` to ensure
     consistent timeouts and headers. The response body is then parsed by
     ``feedparser`` to handle various feed formats.
+
+    A ``304 Not Modified`` reuses the cached body, or returns no entries at
+    all with ``skip_unchanged=True`` for callers that already processed them.
     """
     if source.type != "rss":
         raise ValueError("fetch_rss_entries requires a source of type 'rss'")
 
     logger.debug("Fetching RSS from %s", source.url)
+    cached = lookup(source.url)
     try:
-        resp = requests.get(source.url, headers=_DEFAULT_HEADERS, timeout=timeout)
+        resp = get_session().get(
+            source.url, headers={**_DEFAULT_HEADERS, **conditional_headers(cached)}, timeout=timeout
+        )
         if resp.status_code >= 400:
             logger.warning("RSS fetch failed (%s): %s", resp.status_code, source.url)
             resp.raise_for_status()
-        parsed = feedparser.parse(resp.content)
     except requests.RequestException as exc:
         logger.warning("RSS request error for %s: %s", source.url, exc)
         raise
 
-    items: List[RSSItem] = []
-    if getattr(parsed, "bozo", False):
-        # feedparser sets bozo when it encounters a feed error but may still parse entries
-        logger.debug("Feed 'bozo' flagged for %s: %s", source.url, getattr(parsed, "bozo_exception", None))
-
-    for entry in getattr(parsed, "entries", []) or []:
-        title = getattr(entry, "title", None) or ""
-        link = getattr(entry, "link", None) or ""
-        # Prefer 'summary' but fall back to 'description' or content[0].value
-        description = getattr(entry, "summary", None) or getattr(entry, "description", None)
-        published = _parse_datetime(entry)
-
-        content_val = None
-        contents = getattr(entry, "content", None)
-        if contents and isinstance(contents, list) and contents:
-            content_val = contents[0].get("value")
-        if not content_val:
-            # Fallback to description if content not provided
-            content_val = description
-
-        items.append(
-            RSSItem(
-                title=title,
-                link=link,
-                description=description,
-                published=published,
-                content=content_val,
-            )
-        )
-
+    if resp.status_code == 304 and cached is not None:
+        if skip_unchanged:
+            logger.debug("RSS not modified, skipping: %s", source.url)
+            return []
+        logger.debug("RSS not modified, reusing cached body: %s", source.url)
+        data = cached.body
+    else:
+        data = resp.content
+        store_response(source.url, resp, data)
+    items = _parse_feed(data, source)
     logger.info("Fetched %d RSS entries from %s", len(items), source.name)
     return items
@@ -0,0 +1,41 @@
+"""Shared HTTP session for the fetchers.
+
+One ``requests.Session`` per process keeps TCP/TLS connections alive across
+sources on the same host. The pool is sized for the concurrent fetch worker
+pool (see ``Orchestrator.fetch_all``).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # Retries cover connection-level failures only; HTTP errors still surface
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _build_session()
+    return _SESSION
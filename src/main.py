@@ -11,7 +11,9 @@ from __future__ import annotations
 import argparse
 import os
 import logging
+from datetime import datetime
 from pathlib import Path
+from typing import List
 
 from .utils.logging import configure_logging, get_logger
 from .utils.config_loader import load_sources_config
@@ -24,6 +26,7 @@ from .analysis import (
 )
 from .pipeline.issue_pipeline import run_auto_issue_pipeline
 from .utils.pipeline_config import PipelineConfig
+from .models import Article, Source
 
 
 def parse_args() -> argparse.Namespace:
@@ -99,6 +102,16 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _fetch_candidates(sources: List[Source], args: argparse.Namespace) -> List[Article]:
+    """Fetch-only pass (no processing or issue creation) over ``sources``."""
+    orch = Orchestrator(
+        dry_run=True,
+        max_items_per_source=args.max_items_per_source,
+        max_total_items=args.max_total_items,
+    )
+    return orch.fetch_all(sources)
+
+
 def main() -> int:
     # Optional: load .env
     try:
@@ -123,12 +136,7 @@ def main() -> int:
 
     if args.analysis_only:
         # Lightweight fetch-only to build candidate list for prioritization
-        orch = Orchestrator(
-            dry_run=True,
-            max_items_per_source=args.max_items_per_source,
-            max_total_items=args.max_total_items,
-        )
-        prior_arts = orch.fetch_all(sources)
+        prior_arts = _fetch_candidates(sources, args)
         items = prioritize_articles(prior_arts, horizon_weeks=args.horizon_weeks)
         path = write_monthly_analysis_file(items, horizon_weeks=args.horizon_weeks)
         logger.info("Wrote monthly analysis to %s", path)
@@ -136,12 +144,7 @@ def main() -> int:
 
     if args.monthly_data_only:
         # Build processed articles quickly
-        orch = Orchestrator(
-            dry_run=True,
-            max_items_per_source=args.max_items_per_source,
-            max_total_items=args.max_total_items,
-        )
-        prior_arts = orch.fetch_all(sources)
+        prior_arts = _fetch_candidates(sources, args)
         summary = build_monthly_summary(prior_arts, horizon_weeks=args.horizon_weeks)
         if args.commit_monthly_data and not args.dry_run:
             path_repo = write_monthly_data_to_repo(summary)
@@ -156,12 +159,7 @@ def main() -> int:
 
     if args.preview_candidates or args.create_candidates:
         # Read monthly summary via fetch path to reuse existing processing; selection uses Article objects
-        orch = Orchestrator(
-            dry_run=True,
-            max_items_per_source=args.max_items_per_source,
-            max_total_items=args.max_total_items,
-        )
-        candidates_src = orch.fetch_all(sources)
+        candidates_src = _fetch_candidates(sources, args)
         from .analysis.monthly_gate import ensure_monthly_ready
         from .analysis.category_selector import select_with_redistribution
 
@@ -181,26 +179,26 @@ def main() -> int:
             from .output.github_client import GitHubClient
             from .output.issue_formatter import labels_for_article, format_issue_title, format_issue_body
             gh = GitHubClient(dry_run=args.dry_run)
-            created = 0
-            for cat, items in per_cat.items():
-                for it in items:
-                    a = it.article
-                    labels = labels_for_article(a) + [f"month-{datetime.now().strftime('%Y-%m')}", "candidate"]
-                    gh.create_issue(title=format_issue_title(a), body=format_issue_body(a), labels=labels)
-                    created += 1
+            # Format everything up front so no POST waits on formatting; the batch
+            # call sends them back to back (GraphQL where the labels already exist)
+            month_labels = [f"month-{datetime.now().strftime('%Y-%m')}", "candidate"]
+            payloads = [
+                {
+                    "title": format_issue_title(it.article),
+                    "body": format_issue_body(it.article),
+                    "labels": labels_for_article(it.article) + month_labels,
+                }
+                for items in per_cat.values()
+                for it in items
+            ]
+            gh.create_issues_batch(payloads, delay_seconds=0)
+            created = len(payloads)
             logger.info("Created %s candidate issues", created)
             return 0
 
     if args.auto_issues:
         # Fetch only to build candidate list; do not create per-article issues here
-        orch = Orchestrator(
-            dry_run=True,
-            max_items_per_source=args.max_items_per_source,
-            max_total_items=args.max_total_items,
-        )
-        candidates = []
-        for src in sources:
-            candidates.extend(orch._fetch_source(src))
+        candidates = _fetch_candidates(sources, args)
         cfg = PipelineConfig()
         results = run_auto_issue_pipeline(
             candidates,
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
-import logging
+import os
 import time
-from typing import Iterable, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 
 from .fetchers import fetch_rss_entries, fetch_http_entries
 from .models import Article, Source
 from .processors import (
     Deduplicator,
-    clean_html_to_text,
     batch_normalize,
     classify_text,
     summarize_text,
 )
 from .processors.impact import generate_impact_points
+from .processors.normalize import shutdown_process_pool
+from .processors.result_cache import CachedResult, get_result_cache, result_key
 from .analysis.monthly_archive import MonthlyArchive
 from .output.issue_formatter import (
     format_issue_title,
@@ -23,10 +27,21 @@ from .output.issue_formatter import (
 )
 from .output.github_client import GitHubClient
 from .utils.logging import get_logger
-from .analysis.duplicate_tracker import DuplicateTracker
 
 logger = get_logger("ja.orchestrator")
 
+T = TypeVar("T")
+
+# Finished articles whose issues are created together (one GraphQL mutation)
+_ISSUE_BATCH_SIZE = 20
+
+
+def _timed(fn: Callable[[str], T], text: str) -> Tuple[T, float]:
+    """Call ``fn(text)`` and return its result with the elapsed milliseconds."""
+    t0 = time.perf_counter()
+    result = fn(text)
+    return result, (time.perf_counter() - t0) * 1000
+
 
 class Orchestrator:
     def __init__(
@@ -37,41 +52,87 @@ class Orchestrator:
         max_total_items: int | None = None,
     ) -> None:
         self.dry_run = dry_run
+        self.fast_dry = bool(os.getenv("FAST_DRY_RUN")) and dry_run
         self.max_items_per_source = max_items_per_source
         self.max_total_items = max_total_items
+        # Fetching is I/O bound: size the pool for network concurrency, not CPUs
+        self.fetch_workers = max(1, int(os.getenv("FETCH_MAX_WORKERS", "32")))
+        # Articles whose classify/summarize/impact stages may be in flight at once
+        self.article_workers = max(1, int(os.getenv("ARTICLE_MAX_WORKERS", "4")))
         self.dedup = Deduplicator()
+        self.results = get_result_cache()
+        # Opt-in: an unchanged feed (304) is only safe to skip when every run is
+        # uncapped, otherwise an earlier capped run may never have seen part of it
+        self.skip_unchanged_feeds = (
+            bool(os.getenv("SKIP_UNCHANGED_FEEDS"))
+            and max_items_per_source is None
+            and max_total_items is None
+        )
         self.archive = MonthlyArchive(base_dir=Path("/app/data") if Path("/app/data").exists() else Path("data/archive"))
 
-    def _fetch_source(self, source: Source) -> List[Article]:
-        articles: List[Article] = []
+    def _iter_source(self, source: Source) -> Iterator[Article]:
         try:
             if source.type == "rss":
-                for item in fetch_rss_entries(source):
+                for item in fetch_rss_entries(source, skip_unchanged=self.skip_unchanged_feeds):
                     raw_text = item.content or item.description or ""
-                    articles.append(
-                        Article(
-                            title=item.title,
-                            url=item.link,
-                            source=source.name,
-                            raw_text=raw_text,
-                            published_date=item.published.isoformat() if item.published else None,
-                        )
+                    yield Article(
+                        title=item.title,
+                        url=item.link,
+                        source=source.name,
+                        raw_text=raw_text,
+                        published_date=item.published.isoformat() if item.published else None,
                     )
             elif source.type == "http":
                 for item in fetch_http_entries(source):
-                    articles.append(
-                        Article(
-                            title=item.title or source.name,
-                            url=item.url,
-                            source=source.name,
-                            raw_text=item.content or item.description or "",
-                        )
+                    yield Article(
+                        title=item.title or source.name,
+                        url=item.url,
+                        source=source.name,
+                        raw_text=item.content or item.description or "",
                     )
             else:
                 logger.warning("Unknown source type: %s", source.type)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Failed to fetch from %s: %s", source.name, exc)
-        return articles
+
+    def _fetch_source(self, source: Source) -> List[Article]:
+        """Fetch one source on a worker thread, capped at ``max_items_per_source``.
+
+        Articles past the cap are never built; the list is materialized here so
+        the network and parsing work stays on the worker.
+        """
+        cap = self.max_items_per_source
+        if cap is not None and cap < 0:
+            cap = None
+        return list(islice(self._iter_source(source), cap))
+
+    @property
+    def _total_cap(self) -> Optional[int]:
+        """``max_total_items`` as a limit; None when unset or negative (no cap)."""
+        cap = self.max_total_items
+        return cap if cap is not None and cap >= 0 else None
+
+    def iter_fetch(self, sources: Iterable[Source]) -> Iterator[List[Article]]:
+        """Yield each source's articles, in source order, as soon as it is fetched.
+
+        Sources are fetched concurrently, so callers can process the first
+        batches while later sources are still downloading. Each batch is capped
+        at ``max_items_per_source``; closing the generator early cancels
+        fetches that have not started yet.
+        """
+        src_list = list(sources)
+        if not src_list:
+            return
+
+        max_workers = min(self.fetch_workers, len(src_list))
+        logger.debug("Starting concurrent fetch for %d sources (workers=%d)", len(src_list), max_workers)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            # map() yields in source order, so caps and dedup see a deterministic sequence
+            for items in executor.map(self._fetch_source, src_list):
+                yield items
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def fetch_all(self, sources: Iterable[Source]) -> List[Article]:
         """Fetch articles from all sources concurrently.
@@ -80,36 +141,127 @@ class Orchestrator:
         truncates the combined result to ``max_total_items`` if configured.
         """
         src_list = list(sources)
-        if not src_list:
-            return []
-
         results: List[Article] = []
-        max_workers = min(16, len(src_list))
-        logger.debug("Starting concurrent fetch for %d sources (workers=%d)", len(src_list), max_workers)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_map = {executor.submit(self._fetch_source, s): s for s in src_list}
-            for fut in as_completed(future_map):
-                s = future_map[fut]
-                try:
-                    items = fut.result() or []
-                except Exception as exc:  # noqa: BLE001 - defensive
-                    logger.exception("Fetch failed for %s: %s", getattr(s, "name", s), exc)
-                    items = []
-
-                if self.max_items_per_source is not None and self.max_items_per_source >= 0:
-                    items = items[: self.max_items_per_source]
-                results.extend(items)
+        for items in self.iter_fetch(src_list):
+            results.extend(items)
 
-        if self.max_total_items is not None and self.max_total_items >= 0:
-            results = results[: self.max_total_items]
+        if self._total_cap is not None:
+            results = results[: self._total_cap]
 
         logger.info("Concurrent fetch complete: total=%d from sources=%d", len(results), len(src_list))
         return results
 
+    def _stream_articles(
+        self, sources: Iterable[Source], fetched: List[Article]
+    ) -> Iterator[Article]:
+        """Normalize and yield articles while later sources are still being fetched.
+
+        Everything yielded is also appended to ``fetched``; ``max_total_items``
+        caps the stream the same way it caps ``fetch_all``.
+        """
+        remaining = self._total_cap
+        stream = self.iter_fetch(sources)
+        try:
+            for items in stream:
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+                items = batch_normalize(items)
+                fetched.extend(items)
+                yield from items
+                if remaining == 0:
+                    break
+        finally:
+            stream.close()
+
+    def _process_article(
+        self, art: Article, stage_pool: ThreadPoolExecutor, fast_dry: bool
+    ) -> Tuple[dict, Tuple[float, float, float]]:
+        """Classify, summarize and format one deduplicated article.
+
+        Returns the issue payload and the (classify, summarize, bullets)
+        timings in milliseconds. Runs on the article pool, so it must not
+        touch shared run state.
+        """
+        classify_ms = summarize_ms = 0.0
+
+        # Content seen before under the same model: reuse its results
+        cache_key = None
+        if not fast_dry and self.results is not None:
+            cache_key = result_key(art.raw_text)
+            cached = self.results.get(cache_key)
+            if cached is not None:
+                art.category = cached.category
+                art.confidence_score = cached.confidence
+                art.summary = cached.summary
+                return self._issue_payload(art, cached.impact_points), (0.0, 0.0, 0.0)
+
+        # Classify, summarize and impact points only depend on raw_text,
+        # so they run side by side; per-stage timings are measured in the worker
+        if not fast_dry:
+            f_cls = stage_pool.submit(_timed, classify_text, art.raw_text)
+            f_sum = stage_pool.submit(_timed, summarize_text, art.raw_text)
+            f_imp = stage_pool.submit(_timed, generate_impact_points, art.raw_text)
+
+        # Classify
+        if fast_dry:
+            art.category = art.category or "Architecture/Infra"
+            art.confidence_score = 0.0
+        else:
+            try:
+                (category, conf), classify_ms = f_cls.result()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Classification failed: %s; using defaults", exc)
+                category, conf = "Architecture/Infra", 0.0
+                cache_key = None  # do not remember fallbacks
+            logger.debug("Classified '%s' as %s (%.2f)", art.title, category, conf)
+            art.category = category
+            art.confidence_score = conf
+
+        # Summarize
+        if fast_dry:
+            # crude first-sentences heuristic for dry-run speed; maxsplit stops
+            # after 60 words, and a 61st entry means the text was longer
+            words = art.raw_text.split(None, 60)
+            art.summary = " ".join(words[:60]) + ("..." if len(words) > 60 else "")
+        else:
+            try:
+                art.summary, summarize_ms = f_sum.result()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Summarization failed: %s; leaving summary pending", exc)
+                art.summary = "(summary pending)"
+                cache_key = None
+
+        # Impact points
+        # impact generator has internal fallback; keep as-is for now
+        if fast_dry:
+            impact_points, bullets_ms = _timed(generate_impact_points, art.raw_text)
+        else:
+            impact_points, bullets_ms = f_imp.result()
+
+        if cache_key is not None:
+            self.results.put(
+                cache_key,
+                CachedResult(
+                    category=art.category,
+                    confidence=art.confidence_score,
+                    summary=art.summary,
+                    impact_points=impact_points,
+                ),
+            )
+        return self._issue_payload(art, impact_points), (classify_ms, summarize_ms, bullets_ms)
+
+    @staticmethod
+    def _issue_payload(art: Article, impact_points: List[str]) -> dict:
+        labels = labels_for_article(art)
+        return {
+            "title": format_issue_title(art),
+            "body": format_issue_body(art, impact_points=impact_points, labels=labels),
+            "labels": labels,
+        }
+
     def run(self, sources: Iterable[Source]) -> None:
-        prior_titles: List[str] = []
         gh = GitHubClient(dry_run=self.dry_run)
-        dup = DuplicateTracker()
 
         fetched_count = 0
         created_issues = 0
@@ -119,87 +271,86 @@ class Orchestrator:
         bullets_ms = 0.0
 
         processed_non_duplicate = 0
-        import os
-        fast_dry = bool(os.getenv("FAST_DRY_RUN")) and self.dry_run
-
-        # Fetch concurrently up-front for better throughput
-        fetched_all = self.fetch_all(sources)
-        fetched_count += len(fetched_all)
-
-        # Normalize in batch for consistency and performance
-        fetched_all = batch_normalize(fetched_all)
-        for art in fetched_all:
-
-                # Deduplicate
-                is_dup, reason = self.dedup.is_duplicate(art, prior_titles=prior_titles)
-                if is_dup:
-                    duplicates += 1
-                    logger.info("Skipping duplicate (%s): %s", reason, art.title)
+        cap = self._total_cap
+        fast_dry = self.fast_dry
+
+        # Process articles as their source arrives instead of waiting for every
+        # fetch; each source's batch is still normalized in one go
+        fetched_all: List[Article] = []
+        stream = self._stream_articles(sources, fetched_all)
+        # Dedup stays on this thread so its outcome does not depend on timing;
+        # the model stages of several articles are in flight at once. Each
+        # article job waits on three stage tasks, so the stage pool is sized to match.
+        article_pool = ThreadPoolExecutor(max_workers=self.article_workers)
+        stage_pool = ThreadPoolExecutor(max_workers=3 * self.article_workers)
+        jobs: Deque[Tuple[Article, Future]] = deque()
+        ready: List[Tuple[Article, dict]] = []
+
+        def collect(block: bool) -> None:
+            # Finished jobs in article order; a failed one is skipped and, since
+            # it was never persisted as seen, picked up again by the next run
+            nonlocal classify_ms, summarize_ms, bullets_ms
+            while jobs and (block or jobs[0][1].done()):
+                art, job = jobs.popleft()
+                try:
+                    payload, (c_ms, s_ms, b_ms) = job.result()
+                except Exception as exc:  # noqa: BLE001 - one article must not sink the run
+                    logger.warning("Processing failed for %s: %s", art.title, exc)
                     continue
-                self.dedup.mark_seen(art)
-                prior_titles.append(art.title)
-
-                # Classify
-                if fast_dry:
-                    art.category = art.category or "Architecture/Infra"
-                    art.confidence_score = 0.0
-                else:
-                    t0 = time.perf_counter()
-                    try:
-                        category, conf = classify_text(art.raw_text)
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning("Classification failed: %s; using defaults", exc)
-                        category, conf = "Architecture/Infra", 0.0
-                    classify_ms += (time.perf_counter() - t0) * 1000
-                    logger.debug("Classified '%s' as %s (%.2f)", art.title, category, conf)
-                    art.category = category
-                    art.confidence_score = conf
-
-                # Summarize
-                if fast_dry:
-                    # crude first-sentences heuristic for dry-run speed
-                    first_words = " ".join(art.raw_text.split()[:60])
-                    art.summary = first_words + ("..." if len(art.raw_text.split()) > 60 else "")
-                else:
-                    t0 = time.perf_counter()
-                    try:
-                        art.summary = summarize_text(art.raw_text)
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning("Summarization failed: %s; leaving summary pending", exc)
-                        art.summary = "(summary pending)"
-                    summarize_ms += (time.perf_counter() - t0) * 1000
-
-                # Impact points
-                t0 = time.perf_counter()
-                # impact generator has internal fallback; keep as-is for now
-                impact_points = generate_impact_points(art.raw_text)
-                bullets_ms += (time.perf_counter() - t0) * 1000
-
-                # Create single-article issue immediately
-                title = format_issue_title(art)
-                body = format_issue_body(art, impact_points=impact_points)
-                labels = labels_for_article(art)
-                gh.create_issue(title=title, body=body, labels=labels)
-                created_issues += 1
-                processed_non_duplicate += 1
-
-                if (
-                    self.max_total_items is not None
-                    and self.max_total_items >= 0
-                    and processed_non_duplicate >= self.max_total_items
-                ):
-                    logger.info(
-                        "Reached max_total_items=%s; stopping early",
-                        self.max_total_items,
-                    )
-                    break
+                ready.append((art, payload))
+                classify_ms += c_ms
+                summarize_ms += s_ms
+                bullets_ms += b_ms
+
+        def create_ready() -> None:
+            nonlocal created_issues
+            batch = ready[:_ISSUE_BATCH_SIZE]
+            del ready[:_ISSUE_BATCH_SIZE]
+            try:
+                results = gh.create_issues_batch([payload for _, payload in batch])
+            except Exception as exc:  # noqa: BLE001 - these articles stay unseen for a retry
+                logger.warning("Issue creation failed for %s articles: %s", len(batch), exc)
+                return
+            # Only articles whose issue exists are stored as seen; dry runs store all
+            for (art, _), num in zip(batch, results):
+                if num is not None or self.dry_run:
+                    self.dedup.persist_seen(art)
+                    created_issues += 1
+
+        for art in stream:
+            # Deduplicate; mark_seen() indexes each kept title on the deduplicator
+            # (lowercased, bucketed by length), so no prior_titles are passed.
+            # It is persisted only once the article's issue has been created.
+            is_dup, reason = self.dedup.is_duplicate(art)
+            if is_dup:
+                duplicates += 1
+                logger.info("Skipping duplicate (%s): %s", reason, art.title)
+                continue
+            self.dedup.mark_seen(art, persist=False)
 
-            if (
-                self.max_total_items is not None
-                and self.max_total_items >= 0
-                and processed_non_duplicate >= self.max_total_items
-            ):
+            job = article_pool.submit(self._process_article, art, stage_pool, fast_dry)
+            jobs.append((art, job))
+            processed_non_duplicate += 1
+
+            # Issues go out as their articles finish, a GraphQL batch at a time
+            collect(block=False)
+            if len(ready) >= _ISSUE_BATCH_SIZE:
+                create_ready()
+
+            if cap is not None and processed_non_duplicate >= cap:
+                logger.info("Reached max_total_items=%s; stopping early", cap)
                 break
+        # Stops fetches still queued when max_total_items cut the loop short
+        stream.close()
+        # Normalization is over once the stream is closed; free its workers
+        shutdown_process_pool()
+        fetched_count = len(fetched_all)
+
+        collect(block=True)
+        article_pool.shutdown()
+        stage_pool.shutdown()
+        while ready:
+            create_ready()
 
         # Persist processed articles to monthly archive (best effort)
         try:
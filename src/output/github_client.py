@@ -1,16 +1,26 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
-import time
-from typing import Iterable, List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-from github import Github, GithubException
+import requests
 
 from ..utils.logging import get_logger
 
 logger = get_logger("ja.output.github")
 
+_API_URL = "https://api.github.com"
+_GRAPHQL_URL = f"{_API_URL}/graphql"
+# createIssue mutations aliased into one GraphQL document per request
+_GRAPHQL_BATCH_SIZE = 20
+# Above this many requests/points left, batches go out without the pacing delay
+_RATE_LIMIT_HEADROOM = 100
+
 
 class GitHubClient:
     def __init__(self, *, token: Optional[str] = None, repo: Optional[str] = None, dry_run: bool = False) -> None:
@@ -19,48 +29,83 @@ class GitHubClient:
             raise RuntimeError("GITHUB_TOKEN/GITHUB_API_KEY not set and dry_run=False")
         self.repo_name = repo or os.environ.get("GITHUB_REPOSITORY")
         self.dry_run = dry_run
-        self._client = Github(self.token) if self.token else None
-        self._repo = None
-        if self._client and self.repo_name:
-            self._repo = self._client.get_repo(self.repo_name)
+        # One keep-alive session for REST and GraphQL, opened on the first request
+        self._http: Optional[requests.Session] = None
+        # Rate-limit state from the last REST response (X-RateLimit-Remaining/-Reset)
+        self._rl_remaining: Optional[int] = None
+        self._rl_reset_ts = 0.0
+        # REST issue POSTs may run on several threads
+        self._rl_lock = threading.Lock()
+        # GraphQL has its own points budget, reported in the same headers
+        self._gql_remaining: Optional[int] = None
+        self._gql_reset_ts = 0.0
+        # GraphQL node ids, resolved on the first batch and reused afterwards
+        self._repo_node_id: Optional[str] = None
+        self._label_ids: Dict[str, str] = {}
 
-    def _rate_limit_sleep(self) -> None:
-        if not self._client:
-            return
+    def _session(self) -> requests.Session:
+        if self._http is None:
+            # Concurrent REST POSTs must not each open (and leak) their own session
+            with self._rl_lock:
+                if self._http is None:
+                    http = requests.Session()
+                    http.headers.update({
+                        "Authorization": f"Bearer {self.token}",
+                        "Accept": "application/vnd.github+json",
+                        "X-GitHub-Api-Version": "2022-11-28",
+                    })
+                    self._http = http
+        return self._http
+
+    @staticmethod
+    def _retry_after(resp: requests.Response) -> float:
+        """Seconds from a Retry-After header (delta-seconds or HTTP-date); 0 if absent or bad."""
+        value = resp.headers.get("Retry-After")
+        if not value:
+            return 0.0
         try:
-            rl = self._client.get_rate_limit()
-            remaining = None
-            reset_ts = None
-
-            # PyGithub classic style
-            core = getattr(rl, "core", None)
-            if core is not None:
-                remaining = getattr(core, "remaining", None)
-                reset = getattr(core, "reset", None)
-                if hasattr(reset, "timestamp"):
-                    reset_ts = reset.timestamp()
-
-            # Newer overview style (.resources) or dict-like
-            if remaining is None:
-                resources = getattr(rl, "resources", None)
-                core_res = None
-                if resources is not None:
-                    core_res = getattr(resources, "core", None)
-                    if core_res is None and isinstance(resources, dict):
-                        core_res = resources.get("core")
-                if core_res is not None:
-                    remaining = getattr(core_res, "remaining", None) if not isinstance(core_res, dict) else core_res.get("remaining")
-                    reset = getattr(core_res, "reset", None) if not isinstance(core_res, dict) else core_res.get("reset")
-                    if hasattr(reset, "timestamp"):
-                        reset_ts = reset.timestamp()
-
-            if remaining is not None and reset_ts is not None and remaining <= 1:
-                sleep_s = max(0, reset_ts - time.time())
-                logger.info("GitHub rate limit reached; sleeping %.1fs until reset", sleep_s)
-                time.sleep(sleep_s)
-        except Exception as exc:  # noqa: BLE001
-            # If the shape changes or unauthenticated, skip sleeping and try the call
-            logger.debug("Skipping rate limit sleep due to error: %s", exc)
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            logger.debug("Unparseable Retry-After header: %s", value)
+            return 0.0
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    @staticmethod
+    def _parse_rate_limit(resp: requests.Response) -> Tuple[Optional[int], Optional[float]]:
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        reset = resp.headers.get("X-RateLimit-Reset")
+        try:
+            return (
+                int(remaining) if remaining is not None else None,
+                float(reset) if reset is not None else None,
+            )
+        except ValueError:
+            logger.debug("Unparseable rate limit headers: %s/%s", remaining, reset)
+            return None, None
+
+    def _track_rate_limit(self, resp: requests.Response) -> None:
+        remaining, reset = self._parse_rate_limit(resp)
+        with self._rl_lock:
+            if remaining is not None:
+                self._rl_remaining = remaining
+            if reset is not None:
+                self._rl_reset_ts = reset
+
+    def _rate_limit_sleep(self) -> None:
+        # Nothing is known before the first response; that response brings the headers
+        with self._rl_lock:
+            if self._rl_remaining is None or self._rl_remaining > 1:
+                return
+            sleep_s = max(0, self._rl_reset_ts - time.time())
+            self._rl_remaining = None
+        logger.info("GitHub rate limit reached; sleeping %.1fs until reset", sleep_s)
+        time.sleep(sleep_s)
 
     def create_issue(
         self,
@@ -75,56 +120,282 @@ class GitHubClient:
             logger.info("[DRY-RUN] Would create issue: title=%s labels=%s", title, labels)
             return None
 
-        if not self._repo:
-            if not self.repo_name:
-                raise RuntimeError("Repository not provided (env GITHUB_REPOSITORY)")
-            self._repo = self._client.get_repo(self.repo_name)
+        if not self.repo_name:
+            raise RuntimeError("Repository not provided (env GITHUB_REPOSITORY)")
+        url = f"{_API_URL}/repos/{self.repo_name}/issues"
+        payload = {
+            "title": title,
+            "body": body,
+            "labels": labels,
+            "assignees": list(assignees or []),
+        }
 
         backoff = 1.5
         for attempt in range(4):
             try:
                 self._rate_limit_sleep()
-                issue = self._repo.create_issue(
-                    title=title, body=body, labels=labels, assignees=list(assignees or [])
-                )
-                logger.info("Created GitHub issue #%s", issue.number)
-                return issue.number
-            except GithubException as exc:
-                status = getattr(exc, "status", None)
-                if status in (403, 429):
-                    # rate limited or forbidden; try after delay
-                    delay = backoff ** attempt
-                    logger.warning("GitHub API throttled/forbidden (%s). Retrying in %.1fs", status, delay)
-                    time.sleep(delay)
-                    continue
-                if status in (422, 404):
-                    logger.error("GitHub API error %s: %s", status, exc)
-                    raise
-                logger.warning("GitHub exception: %s; retrying", exc)
-                time.sleep(backoff ** attempt)
+                resp = self._session().post(url, json=payload, timeout=30)
+                self._track_rate_limit(resp)
+                status = resp.status_code
+                if status == 201:
+                    number = resp.json()["number"]
+                    logger.info("Created GitHub issue #%s", number)
+                    return number
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Unexpected error creating issue: %s; retrying", exc)
                 time.sleep(backoff ** attempt)
+                continue
+            if status in (403, 429):
+                # rate limited or forbidden; try after delay
+                delay = max(backoff ** attempt, self._retry_after(resp))
+                logger.warning("GitHub API throttled/forbidden (%s). Retrying in %.1fs", status, delay)
+                time.sleep(delay)
+                continue
+            if status in (422, 404):
+                logger.error("GitHub API error %s: %s", status, resp.text[:500])
+                resp.raise_for_status()
+            logger.warning("GitHub API error %s; retrying", status)
+            time.sleep(backoff ** attempt)
         raise RuntimeError("Failed to create issue after retries")
 
+    def _graphql(self, query: str, variables: Optional[dict] = None) -> dict:
+        payload = {"query": query, "variables": variables or {}}
+        resp = self._session().post(_GRAPHQL_URL, json=payload, timeout=30)
+        remaining, reset = self._parse_rate_limit(resp)
+        if remaining is not None:
+            self._gql_remaining = remaining
+        if reset is not None:
+            self._gql_reset_ts = reset
+        resp.raise_for_status()
+        return resp.json()
+
+    def _graphql_pause(self, min_delay: float) -> None:
+        """Pace the next GraphQL batch by the budget the last response reported."""
+        remaining = self._gql_remaining
+        if remaining is not None and remaining <= 1:
+            sleep_s = max(min_delay, self._gql_reset_ts - time.time())
+            logger.info("GitHub GraphQL rate limit reached; sleeping %.1fs until reset", sleep_s)
+        elif remaining is not None and remaining > _RATE_LIMIT_HEADROOM:
+            return
+        else:
+            sleep_s = min_delay
+        if sleep_s > 0:
+            time.sleep(sleep_s)
+
+    def _resolve_node_ids(self) -> str:
+        """Fetch the repository id and its label ids once per client."""
+        if self._repo_node_id is not None:
+            return self._repo_node_id
+        if not self.repo_name or "/" not in self.repo_name:
+            raise RuntimeError("Repository not provided (env GITHUB_REPOSITORY)")
+        owner, name = self.repo_name.split("/", 1)
+        doc = self._graphql(
+            "query($owner: String!, $name: String!) { repository(owner: $owner, name: $name)"
+            " { id labels(first: 100) { nodes { id name } } } }",
+            {"owner": owner, "name": name},
+        )
+        repo = (doc.get("data") or {}).get("repository")
+        if not repo:
+            raise RuntimeError(f"GraphQL repository lookup failed: {doc.get('errors')}")
+        self._label_ids = {n["name"]: n["id"] for n in repo["labels"]["nodes"]}
+        self._repo_node_id = repo["id"]
+        return self._repo_node_id
+
+    def _graphql_create_issues(self, payloads: Sequence[dict]) -> List[Optional[int]]:
+        """Create up to ``_GRAPHQL_BATCH_SIZE`` issues in one aliased mutation.
+
+        Each entry of the result is the new issue number, or None where that
+        alias failed (the caller retries those over REST).
+        """
+        rid = self._resolve_node_ids()
+        params = ["$rid: ID!"]
+        fields = []
+        variables: dict = {"rid": rid}
+        for i, payload in enumerate(payloads):
+            params.append(f"$t{i}: String!, $b{i}: String, $l{i}: [ID!]")
+            fields.append(
+                f"a{i}: createIssue(input: {{repositoryId: $rid, title: $t{i}, body: $b{i},"
+                f" labelIds: $l{i}}}) {{ issue {{ number }} }}"
+            )
+            variables[f"t{i}"] = payload.get("title")
+            variables[f"b{i}"] = payload.get("body")
+            variables[f"l{i}"] = [self._label_ids[x] for x in payload.get("labels") or ["draft"]]
+        doc = self._graphql(f"mutation({', '.join(params)}) {{ {' '.join(fields)} }}", variables)
+        if doc.get("errors"):
+            logger.warning("GraphQL createIssue reported errors: %s", doc["errors"])
+        data = doc.get("data") or {}
+        numbers: List[Optional[int]] = []
+        for i in range(len(payloads)):
+            issue = (data.get(f"a{i}") or {}).get("issue") or {}
+            numbers.append(issue.get("number"))
+        for num in numbers:
+            if num is not None:
+                logger.info("Created GitHub issue #%s", num)
+        return numbers
+
+    def _graphql_eligible(self, payload: dict) -> bool:
+        # Assignees would need user node lookups and unknown labels are only
+        # auto-created by REST, so those payloads keep the REST path
+        if payload.get("assignees"):
+            return False
+        return all(x in self._label_ids for x in payload.get("labels") or ["draft"])
+
+    def _create_from_payload(self, payload: dict) -> Optional[int]:
+        return self.create_issue(
+            title=payload.get("title"),
+            body=payload.get("body"),
+            labels=payload.get("labels"),
+            assignees=payload.get("assignees"),
+        )
+
+    def _try_create_from_payload(self, payload: dict) -> Optional[int]:
+        # One rejected payload (422/404, exhausted retries) must not hide the
+        # numbers of the issues created around it
+        try:
+            return self._create_from_payload(payload)
+        except Exception as exc:  # noqa: BLE001 - reported as None for this slot
+            logger.error("Failed to create issue %r: %s", payload.get("title"), exc)
+            return None
+
+    @staticmethod
+    def _never_reached(exc: Exception) -> bool:
+        """True if a failed request cannot have been executed by GitHub."""
+        if isinstance(exc, requests.exceptions.ConnectTimeout):
+            return True
+        # 4xx means the request was rejected as a whole; 5xx may come after work was done
+        resp = getattr(exc, "response", None)
+        return isinstance(exc, requests.HTTPError) and resp is not None and resp.status_code < 500
+
+    def _issues_created_since(self, since: float) -> Tuple[Dict[str, List[int]], bool]:
+        """Numbers of issues created since ``since``, by title, and whether all were seen."""
+        since_iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(since))
+        url = f"{_API_URL}/repos/{self.repo_name}/issues"
+        found: Dict[str, List[int]] = {}
+        for page in range(1, 4):
+            resp = self._session().get(
+                url,
+                params={
+                    "state": "all", "since": since_iso, "sort": "created",
+                    "direction": "asc", "per_page": 100, "page": page,
+                },
+                timeout=30,
+            )
+            self._track_rate_limit(resp)
+            resp.raise_for_status()
+            items = resp.json()
+            for item in items:
+                # "since" filters on updated_at; older issues touched since then are skipped
+                if "pull_request" not in item and item.get("created_at", "") >= since_iso:
+                    found.setdefault(item.get("title"), []).append(item["number"])
+            if len(items) < 100:
+                return found, True
+        return found, False
+
+    def _reconcile_by_title(
+        self,
+        payloads: Sequence[dict],
+        unsure: List[int],
+        results: List[Optional[int]],
+        *,
+        since: float,
+    ) -> List[int]:
+        """Fill in issues GitHub created despite a failed mutation; return those to resend.
+
+        Payloads are only resent when the listing shows they really are missing,
+        since sending an issue GitHub already has would duplicate it.
+        """
+        if not unsure:
+            return []
+        try:
+            # A minute of slack for clock skew between this host and GitHub
+            existing, complete = self._issues_created_since(since - 60)
+        except Exception as exc:  # noqa: BLE001 - unknown state: do not resend
+            logger.error(
+                "Could not check which of %s issues GitHub created: %s; not resending them",
+                len(unsure), exc,
+            )
+            return []
+        resend: List[int] = []
+        for i in unsure:
+            numbers = existing.get(payloads[i].get("title"))
+            if numbers:
+                results[i] = numbers.pop(0)
+                logger.info("Found GitHub issue #%s created despite the failed batch", results[i])
+            elif complete:
+                resend.append(i)
+            else:
+                logger.error(
+                    "Issue %r may exist already; not resending it", payloads[i].get("title")
+                )
+        return resend
+
     def create_issues_batch(
         self,
         payloads: Iterable[dict],
         *,
         delay_seconds: float = 1.0,
+        max_concurrency: int = 1,
     ) -> List[Optional[int]]:
-        """Create multiple issues sequentially with optional inter-request delay.
+        """Create multiple issues, batching them into GraphQL mutations where possible.
 
         Each payload dict may contain: title (str), body (str), labels (List[str]), assignees (Sequence[str]).
+        GraphQL batches go back to back while the rate-limit headers report more
+        than ``_RATE_LIMIT_HEADROOM`` left; below that they are spaced by
+        ``delay_seconds``, and an exhausted budget waits for the reset. Payloads
+        the GraphQL path cannot take, or that fail there, are POSTed over REST,
+        one at a time by default as GitHub asks of clients (``max_concurrency``
+        allows more in flight). A payload REST rejects gets None.
+        A mutation that failed after reaching GitHub may still have created
+        issues, so those are looked up by title and only resent if missing.
+        Results keep payload order.
         """
-        results: List[Optional[int]] = []
-        for idx, payload in enumerate(payloads):
-            title = payload.get("title")
-            body = payload.get("body")
-            labels = payload.get("labels")
-            assignees = payload.get("assignees")
-            num = self.create_issue(title=title, body=body, labels=labels, assignees=assignees)
-            results.append(num)
-            if delay_seconds and idx + 1 < len(results):
-                time.sleep(delay_seconds)
+        payloads = list(payloads)
+        results: List[Optional[int]] = [None] * len(payloads)
+        if self.dry_run or not payloads:
+            for payload in payloads:
+                self._create_from_payload(payload)
+            return results
+
+        started = time.time()
+        # Never sent to GitHub, so safe to POST; vs sent in a mutation with no
+        # confirmed number, which GitHub may have created anyway
+        rest: List[int] = []
+        unsure: List[int] = []
+        try:
+            self._resolve_node_ids()
+            batched = [i for i in range(len(payloads)) if self._graphql_eligible(payloads[i])]
+        except Exception as exc:  # noqa: BLE001 - nothing was created; REST takes all
+            logger.warning("GraphQL setup failed: %s; using REST", exc)
+            batched = []
+        in_batch = set(batched)
+        rest.extend(i for i in range(len(payloads)) if i not in in_batch)
+        for start in range(0, len(batched), _GRAPHQL_BATCH_SIZE):
+            chunk = batched[start : start + _GRAPHQL_BATCH_SIZE]
+            try:
+                if start:
+                    self._graphql_pause(delay_seconds)
+                numbers = self._graphql_create_issues([payloads[i] for i in chunk])
+            except Exception as exc:  # noqa: BLE001 - sorted out below
+                logger.warning("GraphQL issue batch failed: %s; falling back to REST", exc)
+                (rest if self._never_reached(exc) else unsure).extend(chunk)
+                rest.extend(batched[start + _GRAPHQL_BATCH_SIZE :])
+                break
+            for i, num in zip(chunk, numbers):
+                results[i] = num
+                if num is None:
+                    unsure.append(i)
+        rest.extend(self._reconcile_by_title(payloads, unsure, results, since=started))
+        pending = sorted(rest)
+        if not pending:
+            return results
+
+        workers = max(1, min(max_concurrency, len(pending)))
+        todo = [payloads[i] for i in pending]
+        if workers == 1:
+            created = list(map(self._try_create_from_payload, todo))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                created = list(pool.map(self._try_create_from_payload, todo))
+        for i, num in zip(pending, created):
+            results[i] = num
         return results
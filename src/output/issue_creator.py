@@ -23,8 +23,8 @@ class GitHubIssueCreator:
 
     def create_issue_from_article(self, article: Article, *, assignees: Optional[Sequence[str]] = None) -> Optional[int]:
         title = format_issue_title(article)
-        body = format_issue_body(article)
         labels = labels_for_article(article)
+        body = format_issue_body(article, labels=labels)
         return self.client.create_issue(title=title, body=body, labels=labels, assignees=assignees)
 
     def create_issue_from_group(
@@ -38,7 +38,7 @@ class GitHubIssueCreator:
             logger.info("No articles provided for grouped issue")
             return None
         title = format_group_issue_title(articles)
-        body = format_group_issue_body(articles, impact_points=impact_points)
         # Use first article's category for labels
         labels = labels_for_article(articles[0])
+        body = format_group_issue_body(articles, impact_points=impact_points, labels=labels)
         return self.client.create_issue(title=title, body=body, labels=labels, assignees=assignees)
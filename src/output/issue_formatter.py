@@ -1,19 +1,33 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Sequence
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Sequence
 
 from ..models import Article
 
-_CATEGORY_TO_LABEL = {
+_CATEGORY_TO_LABEL: Mapping[str, str] = MappingProxyType({
     "Agile": "agile",
     "DevOps": "devops",
     "Architecture/Infra": "architecture",
     "Leadership": "leadership",
-}
+})
+# Bound once; None and "" simply miss, so callers need no ``or ""``
+_label_for = _CATEGORY_TO_LABEL.get
 
 
 def labels_for_article(article: Article) -> List[str]:
-    return ["draft", _CATEGORY_TO_LABEL.get(article.category or "", "uncategorized")]
+    return ["draft", _label_for(article.category, "uncategorized")]
+
+
+def _append_points(parts: List[str], impact_points: Sequence[str]) -> None:
+    """Append impact points as a bullet list, or a TBD bullet if there are none."""
+    if not impact_points:
+        parts.append("- TBD")
+        return
+    for i, p in enumerate(impact_points):
+        if i:
+            parts.append("\n")
+        parts += ["- ", p]
 
 
 def format_issue_title(article: Article) -> str:
@@ -21,19 +35,23 @@ def format_issue_title(article: Article) -> str:
     return f"[{cat}] {article.title}"
 
 
-def format_issue_body(article: Article, impact_points: List[str] | None = None) -> str:
+def format_issue_body(
+    article: Article,
+    impact_points: List[str] | None = None,
+    *,
+    labels: Sequence[str] | None = None,
+) -> str:
+    """Render a single-article issue body; ``labels`` defaults to ``labels_for_article``."""
     impact_points = impact_points or []
-    labels = labels_for_article(article)
-
-    points_md = "\n".join(f"- {p}" for p in impact_points)
-    summary = article.summary or "(summary pending)"
+    if labels is None:
+        labels = labels_for_article(article)
 
-    return (
-        f"### Summary\n\n{summary}\n\n"
-        f"### Impact to teams\n\n{points_md if points_md else '- TBD'}\n\n"
-        f"### Original Source\n\n{article.url}\n\n"
-        f"---\nLabels: {', '.join(labels)}\n"
-    )
+    parts = ["### Summary\n\n", article.summary or "(summary pending)", "\n\n"]
+    parts.append("### Impact to teams\n\n")
+    _append_points(parts, impact_points)
+    parts += ["\n\n### Original Source\n\n", article.url, "\n\n"]
+    parts += ["---\nLabels: ", ", ".join(labels), "\n"]
+    return "".join(parts)
 
 
 def format_group_issue_title(articles: Sequence[Article]) -> str:
@@ -41,7 +59,7 @@ def format_group_issue_title(articles: Sequence[Article]) -> str:
         return "[Draft] Untitled Group"
     primary_cat = articles[0].category or "Uncategorized"
     first_title = articles[0].title
-    suffix = "; ".join(a.title for a in articles[1:3])
+    suffix = "; ".join([a.title for a in articles[1:3]])
     tail = f"; {suffix}" if suffix else ""
     return f"[{primary_cat}] Topic roundup: {first_title}{tail}"
 
@@ -50,38 +68,43 @@ def format_group_issue_body(
     articles: Sequence[Article],
     *,
     impact_points: Sequence[str] | None = None,
+    labels: Sequence[str] | None = None,
 ) -> str:
     """Render a multi-article issue body.
 
     Sections: Combined Summary, Impact to teams, Sources, Per-article notes.
+    ``labels`` defaults to those of the first article (just "draft" if empty).
     """
     impact_points = list(impact_points or [])
-    labels = ["draft"]
-    # Include primary category label if available
-    if articles:
-        labels.append(_CATEGORY_TO_LABEL.get(articles[0].category or "", "uncategorized"))
-
-    combined_summary = "\n\n".join(
-        f"- {a.summary or '(summary pending)'}" for a in articles
-    ) or "(summaries pending)"
-
-    sources_md = "\n".join(f"- [{a.title}]({a.url}) — {a.source}" for a in articles)
-
-    per_article_md = "\n\n".join(
-        (
-            f"#### {a.title}\n"
-            f"Category: {a.category or '-'}\n\n"
-            f"Summary:\n\n{a.summary or '(summary pending)'}\n"
-        )
-        for a in articles
-    )
-
-    points_md = "\n".join(f"- {p}" for p in impact_points)
-
-    return (
-        f"### Combined Summary\n\n{combined_summary}\n\n"
-        f"### Impact to teams\n\n{points_md if points_md else '- TBD'}\n\n"
-        f"### Original Sources\n\n{sources_md if sources_md else '-'}\n\n"
-        f"### Notes by source\n\n{per_article_md}\n\n"
-        f"---\nLabels: {', '.join(labels)}\n"
-    )
+    if labels is None:
+        labels = labels_for_article(articles[0]) if articles else ["draft"]
+
+    # Sections are appended piecewise and joined once at the end
+    parts: List[str] = ["### Combined Summary\n\n"]
+    for i, a in enumerate(articles):
+        if i:
+            parts.append("\n\n")
+        parts += ["- ", a.summary or "(summary pending)"]
+    if not articles:
+        parts.append("(summaries pending)")
+
+    parts.append("\n\n### Impact to teams\n\n")
+    _append_points(parts, impact_points)
+
+    parts.append("\n\n### Original Sources\n\n")
+    for i, a in enumerate(articles):
+        if i:
+            parts.append("\n")
+        parts += ["- [", a.title, "](", a.url, ") — ", a.source]
+    if not articles:
+        parts.append("-")
+
+    parts.append("\n\n### Notes by source\n\n")
+    for i, a in enumerate(articles):
+        if i:
+            parts.append("\n\n")
+        parts += ["#### ", a.title, "\nCategory: ", a.category or "-", "\n\n"]
+        parts += ["Summary:\n\n", a.summary or "(summary pending)", "\n"]
+
+    parts += ["\n\n---\nLabels: ", ", ".join(labels), "\n"]
+    return "".join(parts)
@@ -49,26 +49,27 @@ def run_auto_issue_pipeline(
     gh = GitHubClient(dry_run=dry_run)
 
     payloads = []
+    sent_groups: List[List[Article]] = []
     for grp in groups:
         if dup.has_seen_articles(grp):
             logger.info("Skipping duplicate group with first title: %s", grp[0].title)
             continue
-        title = format_group_issue_title(grp)
-        body = format_group_issue_body(grp)
-        # label by the first article's category
+        # label by the first article's category; the body lists the same labels
         labels = labels_for_article(grp[0])
         payloads.append({
-            "title": title,
-            "body": body,
+            "title": format_group_issue_title(grp),
+            "body": format_group_issue_body(grp, labels=labels),
             "labels": labels,
             "assignees": list(default_assignees or []),
         })
+        sent_groups.append(grp)
 
     results = gh.create_issues_batch(payloads, delay_seconds=1.0)
 
-    # Record created ones
-    for grp, num in zip(groups, results):
+    # Record created ones (results line up with the groups actually sent)
+    for grp, num in zip(sent_groups, results):
         if num is not None:
             dup.record_issue(title=grp[0].title, articles=grp, issue_number=num)
+    dup.flush()
 
     return results
@@ -2,8 +2,8 @@
 
 from .normalize import clean_html_to_text, normalize_plain_text, normalize_article, batch_normalize, parse_date_to_iso
 from .dedup import Deduplicator
-from .classify import classify_text
-from .summarize import summarize_text
+from .classify import classify_text, classify_texts
+from .summarize import summarize_text, summarize_texts
 
 __all__ = [
     "clean_html_to_text",
@@ -13,5 +13,7 @@ __all__ = [
     "parse_date_to_iso",
     "Deduplicator",
     "classify_text",
+    "classify_texts",
     "summarize_text",
+    "summarize_texts",
 ]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from ...utils.logging import get_logger
+
+T = TypeVar("T")
+logger = get_logger("ja.ai.batch")
+
+
+def map_texts(
+    fn: Callable[[str], T],
+    texts: Sequence[str],
+    *,
+    default: Optional[T] = None,
+    max_workers: Optional[int] = None,
+    what: str = "AI call",
+) -> List[T]:
+    """Apply ``fn`` to every text with several requests in flight, keeping order.
+
+    The backends are remote HTTP APIs without a batch endpoint, so batching
+    means overlapping the calls. ``AI_MAX_CONCURRENCY`` (default 4) bounds the
+    concurrency. Without ``default`` the first failure is raised, like
+    ``map()``; with it, a failed text logs a warning and gets ``default``.
+    """
+    if not texts:
+        return []
+    if max_workers is None:
+        try:
+            max_workers = int(os.getenv("AI_MAX_CONCURRENCY", "4"))
+        except ValueError:
+            max_workers = 4
+    max_workers = max(1, min(max_workers, len(texts)))
+
+    def call(text: str) -> T:
+        if default is None:
+            return fn(text)
+        try:
+            return fn(text)
+        except Exception as exc:  # noqa: BLE001 - caller chose a fallback value
+            logger.warning("%s failed: %s; using default", what, exc)
+            return default
+
+    if max_workers == 1:
+        return [call(t) for t in texts]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(call, texts))
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+import threading
+from typing import Dict, Optional
 
 from .base import AIClient
 
+# One client per backend for the whole process, so their keep-alive sessions
+# are shared by every classify/summarize/impact call and worker thread
+_CLIENTS: Dict[str, AIClient] = {}
+_CLIENTS_LOCK = threading.Lock()
 
-def create_ai_client(*, backend: Optional[str] = None) -> AIClient:
-    """Create an AI client based on PROCESSING_BACKEND env or explicit value.
-
-    Supported values: "ollama" (default) or "gemini". No local fallbacks.
-    """
-    selected = (backend or os.environ.get("PROCESSING_BACKEND", "ollama")).lower()
 
+def _new_client(selected: str) -> AIClient:
     if selected == "ollama":
         from .ollama import OllamaClient  # lazy import
 
@@ -25,3 +25,20 @@ def create_ai_client(*, backend: Optional[str] = None) -> AIClient:
     raise ValueError(
         f"Unsupported PROCESSING_BACKEND '{selected}'. Use 'ollama' or 'gemini'."
     )
+
+
+def create_ai_client(*, backend: Optional[str] = None) -> AIClient:
+    """Create an AI client based on PROCESSING_BACKEND env or explicit value.
+
+    Supported values: "ollama" (default) or "gemini". No local fallbacks.
+    The client is built on first use per backend and reused afterwards.
+    """
+    selected = (backend or os.environ.get("PROCESSING_BACKEND", "ollama")).lower()
+
+    client = _CLIENTS.get(selected)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(selected)
+            if client is None:
+                client = _CLIENTS[selected] = _new_client(selected)
+    return client
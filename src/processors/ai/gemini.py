@@ -4,7 +4,9 @@ import os
 from typing import Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from ...utils import jsonio
 from .base import AIClient
 from .parsing import parse_classification_response
 
@@ -22,13 +24,19 @@ class GeminiClient(AIClient):
         if not self.api_key:
             raise RuntimeError("GOOGLE_API_KEY is required for Gemini backend")
         self.model = os.environ.get("GEMINI_MODEL", "gemini-1.5-flash")
-
-    def _generate(self, prompt: str, *, temperature: float = 0.2, timeout: int = 60) -> str:
         # Google AI Studio text generation endpoint
-        url = (
+        self._url = (
             "https://generativelanguage.googleapis.com/v1beta/models/"
-            f"{self.model}:generateContent?key={self.api_key}"
+            f"{self.model}:generateContent"
+        )
+        # Keep-alive session so calls after the first skip the TCP+TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
         )
+
+    def _generate(self, prompt: str, *, temperature: float = 0.2, timeout: int = 60) -> str:
         payload = {
             "contents": [
                 {
@@ -37,9 +45,11 @@ class GeminiClient(AIClient):
             ],
             "generationConfig": {"temperature": temperature},
         }
-        resp = requests.post(url, json=payload, timeout=timeout)
+        resp = self.session.post(
+            self._url, params={"key": self.api_key}, data=jsonio.dumps(payload), timeout=timeout
+        )
         resp.raise_for_status()
-        data = resp.json()
+        data = jsonio.loads(resp.content)
         # Extract text from the first candidate
         candidates = data.get("candidates") or []
         if not candidates:
@@ -1,14 +1,75 @@
 from __future__ import annotations
 
 import os
-from typing import Tuple
+from typing import Callable, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from ...utils import jsonio
 from .base import AIClient
 from .parsing import parse_classification_response
 
 
+def _chat_content(data: dict) -> str:
+    # Chat API returns {'message': {'content': '...'}} or {'response': '...'} depending on version
+    msg = data.get("message") or {}
+    return (msg.get("content") if isinstance(msg, dict) else None) or data.get("response", "") or ""
+
+
+class _ObjectEnd:
+    """Incremental scanner that reports when the first JSON object closes."""
+
+    __slots__ = ("depth", "in_string", "escaped")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        for ch in chunk:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                # Strings only matter inside the object; prose quotes before it are ignored
+                self.in_string = self.depth > 0
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}" and self.depth:
+                self.depth -= 1
+                if not self.depth:
+                    return True
+        return False
+
+
+def _read_until_json(resp: requests.Response, extract: Callable[[dict], str]) -> str:
+    """Collect streamed NDJSON text pieces until a JSON object is complete or the stream ends."""
+    parts = []
+    scanner = _ObjectEnd()
+    try:
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            data = jsonio.loads(line)
+            piece = extract(data)
+            if piece:
+                parts.append(piece)
+                if scanner.feed(piece):
+                    break
+            if data.get("done"):
+                break
+    finally:
+        # Closing mid-stream drops the connection, which ends generation server side
+        resp.close()
+    return "".join(parts).strip()
+
+
 class OllamaClient(AIClient):
     """HTTP client for Ollama's chat/completions API.
 
@@ -23,8 +84,27 @@ class OllamaClient(AIClient):
         # Tuning knobs for speed/latency in local dev
         self.timeout = int(os.environ.get("OLLAMA_TIMEOUT", os.environ.get("AI_TIMEOUT", "30")))
         self.num_predict = int(os.environ.get("OLLAMA_NUM_PREDICT", "200"))
+        # Keep-alive session: classify/summarize run concurrently against one host
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _chat(
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.2,
+        timeout: int | None = None,
+        stop_after_json: bool = False,
+    ) -> str:
+        """Run ``prompt`` and return the model text.
 
-    def _chat(self, prompt: str, *, temperature: float = 0.2, timeout: int | None = None) -> str:
+        With ``stop_after_json`` the reply is streamed and the connection is
+        dropped once the first complete JSON object has arrived, so the model
+        does not have to finish whatever it adds after the answer.
+        """
         to = timeout or self.timeout
         generate_url = f"{self.host}/api/generate"
         chat_url = f"{self.host}/api/chat"
@@ -32,36 +112,44 @@ class OllamaClient(AIClient):
         payload_generate = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": stop_after_json,
             "options": {"temperature": temperature, "num_predict": self.num_predict},
         }
 
         try:
-            resp = requests.post(generate_url, json=payload_generate, timeout=to)
+            resp = self.session.post(
+                generate_url,
+                data=jsonio.dumps(payload_generate),
+                timeout=to,
+                stream=stop_after_json,
+            )
             if resp.status_code == 404:
                 # Fallback to chat API for newer servers
                 raise requests.HTTPError("404 on /api/generate", response=resp)
             resp.raise_for_status()
-            data = resp.json()
+            if stop_after_json:
+                return _read_until_json(resp, lambda d: d.get("response", ""))
+            data = jsonio.loads(resp.content)
             return data.get("response", "").strip()
         except requests.HTTPError as http_err:
             if getattr(http_err, "response", None) is not None and http_err.response.status_code == 404:
+                http_err.response.close()
                 # Try chat API
                 payload_chat = {
                     "model": self.model,
                     "messages": [
                         {"role": "user", "content": prompt},
                     ],
-                    "stream": False,
+                    "stream": stop_after_json,
                     "options": {"temperature": temperature, "num_predict": self.num_predict},
                 }
-                resp2 = requests.post(chat_url, json=payload_chat, timeout=to)
+                resp2 = self.session.post(
+                    chat_url, data=jsonio.dumps(payload_chat), timeout=to, stream=stop_after_json
+                )
                 resp2.raise_for_status()
-                data2 = resp2.json()
-                # Chat API returns {'message': {'content': '...'}} or {'response': '...'} depending on version
-                msg = data2.get("message") or {}
-                content = (msg.get("content") if isinstance(msg, dict) else None) or data2.get("response", "")
-                return (content or "").strip()
+                if stop_after_json:
+                    return _read_until_json(resp2, _chat_content)
+                return _chat_content(jsonio.loads(resp2.content)).strip()
             raise
 
     def classify(self, text: str) -> Tuple[str, float]:
@@ -79,7 +167,7 @@ class OllamaClient(AIClient):
             "Do not include markdown, code fences, or extra text.\n\n"
             f"ARTICLE:\n{text}\n"
         )
-        raw = self._chat(prompt)
+        raw = self._chat(prompt, stop_after_json=True)
         return parse_classification_response(raw)
 
     def summarize(self, text: str, *, max_words: int = 150) -> str:
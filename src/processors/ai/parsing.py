@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
-import re
 from typing import Tuple
 
+from ...utils import jsonio
+
 _ALLOWED_CATEGORIES = {"Agile", "DevOps", "Architecture/Infra", "Leadership"}
 
 
@@ -17,11 +17,13 @@ def parse_classification_response(raw: str) -> Tuple[str, float]:
     if not raw or not raw.strip():
         raise ValueError("Empty AI response")
 
-    match = re.search(r"\{[\s\S]*\}", raw)
-    if not match:
+    # Outermost braces: models wrap the object in prose or code fences
+    start = raw.find("{")
+    end = raw.rfind("}")
+    if start == -1 or end <= start:
         raise ValueError("No JSON object found in AI response")
 
-    obj = json.loads(match.group(0))
+    obj = jsonio.loads(raw[start : end + 1])
 
     category_val = obj.get("category", "")
     if not isinstance(category_val, str):
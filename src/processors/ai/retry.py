@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import time
 import os
-from typing import Callable, TypeVar
+import random
+import time
+from functools import lru_cache
+from typing import Callable, Optional, Tuple, TypeVar
 
 from .base import AIClient
 from ...utils.logging import get_logger
@@ -11,21 +13,38 @@ T = TypeVar("T")
 logger = get_logger("ja.ai.retry")
 
 
-def with_retries(fn: Callable[[], T], *, retries: int = 2, backoff: float = 1.5) -> T:
-    # Environment overrides for quick runs: AI_RETRIES, AI_BACKOFF
+@lru_cache(maxsize=1)
+def _env_overrides() -> Tuple[Optional[int], Optional[float]]:
+    """AI_RETRIES / AI_BACKOFF for quick runs; invalid values are ignored.
+
+    Read on the first call rather than at import, so a ``.env`` loaded by
+    ``main()`` after the imports still applies.
+    """
+    retries: Optional[int] = None
+    backoff: Optional[float] = None
     try:
         env_retries = os.getenv("AI_RETRIES")
         if env_retries is not None:
             retries = int(env_retries)
-    except Exception:  # noqa: BLE001 - ignore invalid env
+    except ValueError:
         pass
     try:
         env_backoff = os.getenv("AI_BACKOFF")
         if env_backoff is not None:
             backoff = float(env_backoff)
-    except Exception:  # noqa: BLE001 - ignore invalid env
+    except ValueError:
         pass
+    return retries, backoff
+
+
+def with_retries(fn: Callable[[], T], *, retries: int = 2, backoff: float = 1.5) -> T:
+    env_retries, env_backoff = _env_overrides()
+    if env_retries is not None:
+        retries = env_retries
+    if env_backoff is not None:
+        backoff = env_backoff
     last_exc: BaseException | None = None
+    delay = 1.0
     for attempt in range(retries + 1):
         try:
             return fn()
@@ -33,7 +52,9 @@ def with_retries(fn: Callable[[], T], *, retries: int = 2, backoff: float = 1.5)
             last_exc = exc
             if attempt >= retries:
                 break
-            sleep_s = backoff ** attempt
+            # backoff ** attempt, plus jitter so concurrent callers do not retry in lockstep
+            sleep_s = delay + random.uniform(0, 0.25)
+            delay *= backoff
             logger.warning("AI call failed (attempt %s/%s): %s; retrying in %.1fs", attempt + 1, retries + 1, exc, sleep_s)
             time.sleep(sleep_s)
     assert last_exc is not None
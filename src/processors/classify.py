@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
-from typing import Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import os
+import sys
 
 from .ai import AIClient, create_ai_client
+from .ai.batch import map_texts
 from .ai.retry import classify_with_retry
+from .result_cache import call_key, get_result_cache
 from ..utils.logging import get_logger
 
 logger = get_logger("ja.processors.classify")
@@ -15,7 +18,11 @@ _CATEGORIES = ["Agile", "DevOps", "Architecture/Infra", "Leadership"]
 
 
 def _truncate_words(text: str, max_words: int) -> str:
-    words = text.split()
+    # n words take at least 2n-1 characters, so shorter texts are within the limit
+    if len(text) <= 2 * max_words:
+        return text
+    # maxsplit leaves the tail as one string; a leftover element means it was longer
+    words = text.split(None, max_words)
     return " ".join(words[:max_words]) if len(words) > max_words else text
 
 
@@ -44,9 +51,17 @@ def classify_text(
     except Exception:  # noqa: BLE001
         pass
 
+    cache = get_result_cache()
+    key = call_key("classify", ai, content) if cache is not None else None
+    cached = cache.get_value(key) if key else None
     # Use retry wrapper for resilience against transient backend errors
     try:
-        category, conf = classify_with_retry(ai, content)
+        if cached:
+            category, conf = cached
+        else:
+            category, conf = classify_with_retry(ai, content)
+            if key:
+                cache.put_value(key, [category, conf])
     except Exception as primary_exc:  # noqa: BLE001
         # Optional backend fallback
         fallback_selected = os.getenv("AI_FALLBACK_BACKEND")
@@ -68,4 +83,21 @@ def classify_text(
         logger.warning("Non-numeric confidence '%s' from AI; coercing to 0.0", conf)
         conf_f = 0.0
     conf_f = max(0.0, min(1.0, conf_f))
-    return category, conf_f
+    # Interned so later category lookups compare by identity
+    return sys.intern(category), conf_f
+
+
+def classify_texts(
+    texts: Sequence[str],
+    *,
+    ai: AIClient | None = None,
+    default: Optional[Tuple[str, float]] = None,
+) -> List[Tuple[str, float]]:
+    """Classify several texts through one client, overlapping the backend calls.
+
+    Results keep input order. See ``map_texts`` for concurrency and ``default``.
+    """
+    ai = ai or create_ai_client()
+    return map_texts(
+        lambda t: classify_text(t, ai=ai), texts, default=default, what="Classification"
+    )
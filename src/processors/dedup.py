@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import contextlib
 import difflib
+import functools
 import hashlib
 import json
 import os
+import sqlite3
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..models import Article
 from .normalize import normalize_plain_text
+from ..utils.logging import get_logger
 from dataclasses import dataclass
 from collections import defaultdict
 
@@ -18,12 +22,36 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover - env without numpy
     _np = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process  # type: ignore
+except Exception:  # pragma: no cover - env without rapidfuzz
+    _rf_fuzz = _rf_process = None  # type: ignore
+
+_logger = get_logger("ja.processors.dedup")
+
+# Tag stored with the hashes; a store written with another algorithm keeps
+# only its titles, since its hashes can no longer match
+_HASH_ALGO = "blake2b-128"
+
+# Per-process bound on memoized content hashes and embeddings
+_MEMO_SIZE = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS hashes (hash TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS titles (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL);
+"""
+# Titles persisted for the next run; older rows are pruned every _PRUNE_EVERY inserts
+_PERSIST_TITLES = 5000
+_PRUNE_EVERY = 500
+
 
 class Deduplicator:
     """Detect duplicate or near-duplicate articles.
 
     Strategies:
-    - Persistent SHA-256 hash of normalized title+content
+    - Persistent BLAKE2b-128 hash of normalized title+content (SQLite store
+      next to ``store_path``, imported once from the legacy JSON file)
     - Fuzzy title matching via difflib with configurable threshold
     - Optional semantic similarity via sentence-transformers (in-memory during run)
     """
@@ -54,44 +82,212 @@ class Deduplicator:
 
         self._seen_hashes: set[str] = set()
         self._titles: List[str] = []
-        self._embeddings: List["_np.ndarray"] = []  # type: ignore[name-defined]
+        # Lowercased persisted titles: a set for exact hits and buckets by length
+        # so fuzzy matching only scores titles that could reach the threshold
+        self._title_keys: set[str] = set()
+        self._titles_by_len: Dict[int, List[str]] = {}
+        # Ring buffer of the last max_embeddings vectors as one contiguous float32
+        # matrix (allocated on the first vector, once the dimension is known)
+        self._emb_matrix: Optional["_np.ndarray"] = None  # type: ignore[name-defined]
+        self._emb_count = 0
+        # Embeddings by raw_text, the costliest step: is_duplicate() and
+        # mark_seen() share one, as do articles with the same body (oldest evicted)
+        self._embeddings: Dict[str, object] = {}
         self._model = None
+        # Commits are held back inside batch_writes()
+        self._defer_commit = False
         self._load()
 
     # ---------------- Persistence -----------------
     def _load(self) -> None:
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        db_path = self.store_path.with_suffix(".sqlite3")
+        fresh = not db_path.exists()
+        try:
+            self._db = self._open_db(str(db_path))
+        except sqlite3.DatabaseError as exc:
+            # Corrupt or truncated store: keep it for inspection and start over
+            _logger.warning("Unusable dedup store %s (%s); starting a new one", db_path, exc)
+            backup = db_path.with_name(db_path.name + ".bak")
+            try:
+                db_path.replace(backup)
+                for suffix in ("-wal", "-shm"):
+                    Path(str(db_path) + suffix).unlink(missing_ok=True)
+                self._db = self._open_db(str(db_path))
+            except (OSError, sqlite3.Error):
+                _logger.warning("Could not recreate %s; dedup history kept in memory", db_path)
+                self._db = self._open_db(":memory:")
+            fresh = True
+        if fresh:
+            self._import_json()
+        try:
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'hash'").fetchone()
+            if row is None or row[0] != _HASH_ALGO:
+                with self._db:
+                    self._db.execute("DELETE FROM hashes")
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('hash', ?)",
+                        (_HASH_ALGO,),
+                    )
+            self._seen_hashes = {h for (h,) in self._db.execute("SELECT hash FROM hashes")}
+            rows = self._db.execute(
+                "SELECT title FROM (SELECT id, title FROM titles ORDER BY id DESC LIMIT ?)"
+                " ORDER BY id",
+                (_PERSIST_TITLES,),
+            )
+            self._titles = [t for (t,) in rows]
+        except sqlite3.Error:
+            self._seen_hashes = set()
+            self._titles = []
+        for t in self._titles:
+            self._index_title(t)
+
+    @staticmethod
+    def _open_db(path: str) -> sqlite3.Connection:
+        db = sqlite3.connect(path, check_same_thread=False)
+        try:
+            # Each kept article is one row insert; WAL with synchronous=NORMAL makes
+            # those commits cheap instead of rewriting the whole store every time
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(_SCHEMA)
+        except sqlite3.Error:
+            db.close()
+            raise
+        return db
+
+    def _import_json(self) -> None:
+        """Seed a new store from the JSON file earlier versions rewrote on every article."""
         if not self.store_path.exists():
-            self.store_path.parent.mkdir(parents=True, exist_ok=True)
             return
         try:
             data = json.loads(self.store_path.read_text(encoding="utf-8"))
-            self._seen_hashes = set(data.get("hashes", []))
-            self._titles = list(data.get("titles", []))
-        except Exception:
-            self._seen_hashes = set()
-            self._titles = []
+            with self._db:
+                if data.get("hash") == _HASH_ALGO:
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO hashes (hash) VALUES (?)",
+                        ((h,) for h in data.get("hashes", [])),
+                    )
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('hash', ?)",
+                        (_HASH_ALGO,),
+                    )
+                self._db.executemany(
+                    "INSERT INTO titles (title) VALUES (?)",
+                    ((t,) for t in data.get("titles", [])),
+                )
+        except Exception:  # noqa: BLE001 - an unreadable legacy store starts empty
+            pass
+
+    def _persist(self, content_hash: str, title: Optional[str]) -> None:
+        self._db.execute("INSERT OR IGNORE INTO hashes (hash) VALUES (?)", (content_hash,))
+        if title is not None:
+            row_id = self._db.execute("INSERT INTO titles (title) VALUES (?)", (title,)).lastrowid
+            if row_id % _PRUNE_EVERY == 0:
+                self._db.execute("DELETE FROM titles WHERE id <= ?", (row_id - _PERSIST_TITLES,))
+        if not self._defer_commit:
+            self._db.commit()
+
+    @contextlib.contextmanager
+    def batch_writes(self) -> Iterator[None]:
+        """Commit the ``mark_seen`` calls made inside the block as one transaction."""
+        if self._defer_commit:
+            yield
+            return
+        self._defer_commit = True
+        try:
+            yield
+        finally:
+            self._defer_commit = False
+            self._db.commit()
 
-    def _save(self) -> None:
-        payload = {"hashes": sorted(self._seen_hashes), "titles": self._titles[-5000:]}
-        self.store_path.write_text(
+    def export_json(self, path: Path | str | None = None) -> None:
+        """Write the store in the legacy JSON layout (to ``store_path`` by default)."""
+        payload = {
+            "hash": _HASH_ALGO,
+            "hashes": sorted(self._seen_hashes),
+            "titles": self._titles[-_PERSIST_TITLES:],
+        }
+        Path(path or self.store_path).write_text(
             json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
         )
 
     # ---------------- Normalization helpers -----------------
     @staticmethod
+    @functools.lru_cache(maxsize=_MEMO_SIZE)
     def content_hash(title: str, text: str) -> str:
         # Normalize via lightweight text normalizer to improve robustness
         # Keep legacy lowercasing behavior to avoid breaking existing caches
         t_norm = normalize_plain_text(title or "")
         x_norm = normalize_plain_text(text or "")
         normalized = t_norm.lower() + "\n\n" + x_norm.lower()
-        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
 
     @staticmethod
     def similar_titles(a: str, b: str) -> float:
         return difflib.SequenceMatcher(None, (a or "").lower(), (b or "").lower()).ratio()
 
+    def _index_title(self, title: str) -> None:
+        key = title.lower()
+        self._title_keys.add(key)
+        self._titles_by_len.setdefault(len(key), []).append(key)
+
+    def _unindex_title(self, title: str) -> None:
+        key = title.lower()
+        bucket = self._titles_by_len[len(key)]
+        bucket.remove(key)  # oldest occurrence, matching the trimmed _titles entry
+        if key not in bucket:
+            self._title_keys.discard(key)
+
+    def _matches_title(self, title: str, prior_titles: Iterable[str]) -> bool:
+        """True if ``title`` reaches ``title_threshold`` against any known title.
+
+        Same result as scoring every title with ``similar_titles``, but a ratio
+        can't exceed 2*min(la, lb)/(la + lb), so titles outside that length band
+        are skipped and quick_ratio() filters the rest before the full ratio().
+        With rapidfuzz (>= 3.0) installed its Indel ratio on the unprocessed
+        strings, which is never below difflib's (LCS >= matching blocks),
+        screens each bucket in C instead.
+        """
+        key = (title or "").lower()
+        # Callers normally pass nothing: titles kept via mark_seen() are already indexed
+        extra = {(t or "").lower() for t in prior_titles} if prior_titles else set()
+        if key in self._title_keys or key in extra:
+            return True
+        n = len(key)
+        thr = self.title_threshold
+
+        def in_band(m: int) -> bool:
+            return 2 * min(n, m) >= thr * (n + m) - 1e-9
+
+        sm = difflib.SequenceMatcher(None, key)
+        buckets = [b for m, b in self._titles_by_len.items() if in_band(m)]
+        buckets.append([t for t in extra if in_band(len(t))])
+        for bucket in buckets:
+            if _rf_process is not None:
+                # Lazily yields only titles scoring >= cutoff; difflib confirms
+                cutoff = max(0.0, thr * 100 - 1e-6)
+                # processor=None: rapidfuzz < 3 would otherwise strip punctuation and
+                # case first, and those scores may undercut difflib's
+                hits = _rf_process.extract_iter(
+                    key, bucket, scorer=_rf_fuzz.ratio, processor=None, score_cutoff=cutoff
+                )
+                for t, _score, _idx in hits:
+                    sm.set_seq2(t)
+                    if sm.ratio() >= thr:
+                        return True
+                continue
+            for t in bucket:
+                sm.set_seq2(t)
+                if sm.quick_ratio() >= thr and sm.ratio() >= thr:
+                    return True
+        return False
+
     # ---------------- Semantic similarity -----------------
+    def _semantic_active(self) -> bool:
+        """Whether vectors are worth computing: none are kept if max_embeddings <= 0."""
+        return self.enable_semantic and _np is not None and self.max_embeddings > 0
+
     def _ensure_model(self) -> None:
         if not (self.enable_semantic and _np is not None):
             return
@@ -100,12 +296,31 @@ class Deduplicator:
         try:  # lazy import to avoid heavy startup cost
             from sentence_transformers import SentenceTransformer  # type: ignore
 
-            self._model = SentenceTransformer("all-MiniLM-L6-v2")
+            self._model = self._load_model(SentenceTransformer)
         except Exception:
             # Disable semantic if model cannot be loaded
             self.enable_semantic = False
             self._model = None
 
+    @staticmethod
+    def _load_model(factory):
+        """Load MiniLM, via ONNX Runtime when ``DEDUP_EMBED_BACKEND=onnx``.
+
+        The ONNX backend (sentence-transformers >= 3.2 with onnxruntime) runs
+        the same weights without PyTorch eager overhead; ``DEDUP_EMBED_ONNX_FILE``
+        picks an export from the model repo, e.g. ``onnx/model_qint8_avx512_vnni.onnx``
+        for the INT8-quantized one. Falls back to the default backend on failure.
+        """
+        backend = os.getenv("DEDUP_EMBED_BACKEND", "").lower()
+        if backend == "onnx":
+            onnx_file = os.getenv("DEDUP_EMBED_ONNX_FILE")
+            kwargs = {"model_kwargs": {"file_name": onnx_file}} if onnx_file else {}
+            try:
+                return factory("all-MiniLM-L6-v2", backend="onnx", **kwargs)
+            except Exception:  # noqa: BLE001 - old sentence-transformers or no onnxruntime
+                pass
+        return factory("all-MiniLM-L6-v2")
+
     def _embed(self, text: str):
         self._ensure_model()
         if not self._model:
@@ -115,14 +330,66 @@ class Deduplicator:
             return None
         return _np.asarray(vec)
 
+    def prefetch_embeddings(self, articles: Iterable[Article]) -> None:
+        """Embed the texts of ``articles`` in one batched call for later checks.
+
+        A single ``encode`` over many texts keeps the model busy instead of
+        running it once per article. Articles already known by hash are skipped
+        since they never reach the semantic check.
+        """
+        if not self._semantic_active():
+            return
+        texts = list(dict.fromkeys(
+            a.raw_text
+            for a in articles
+            if a.raw_text
+            and a.raw_text not in self._embeddings
+            and self.content_hash(a.title, a.raw_text) not in self._seen_hashes
+        ))
+        if not texts:
+            return
+        self._ensure_model()
+        if not self._model:
+            return
+        try:
+            vecs = self._model.encode(
+                [t[:8000] for t in texts], batch_size=64, normalize_embeddings=True
+            )
+        except Exception:  # noqa: BLE001 - per-article embedding still works
+            return
+        for text, vec in zip(texts, vecs):
+            self._store_embedding(text, _np.asarray(vec))
+
+    def _store_embedding(self, text: str, vec) -> None:
+        self._embeddings[text] = vec
+        if len(self._embeddings) > _MEMO_SIZE:
+            del self._embeddings[next(iter(self._embeddings))]
+
+    def _article_embedding(self, article: Article):
+        vec = self._embeddings.get(article.raw_text)
+        if vec is None:
+            vec = self._embed(article.raw_text[:8000])  # limit very long texts
+            if vec is not None:
+                self._store_embedding(article.raw_text, vec)
+        return vec
+
     def _max_cosine(self, vec) -> float:
-        if _np is None or not self._embeddings:
+        if _np is None or self._emb_matrix is None or not self._emb_count:
             return 0.0
-        # Using matrix dot product for efficiency
-        mat = _np.vstack(self._embeddings)
-        sims = mat @ vec  # cosine sims because vectors are normalized
+        # Row order is irrelevant for the max, so the filled rows are used as is
+        mat = self._emb_matrix[: min(self._emb_count, len(self._emb_matrix))]
+        sims = mat @ _np.asarray(vec, dtype=_np.float32)  # cosine sims: vectors are normalized
         return float(sims.max()) if sims.size else 0.0
 
+    def _remember_embedding(self, vec) -> None:
+        if self.max_embeddings <= 0:
+            return
+        if self._emb_matrix is None:
+            self._emb_matrix = _np.empty((self.max_embeddings, len(vec)), dtype=_np.float32)
+        # Overwrites the oldest row once full, like trimming to the last N
+        self._emb_matrix[self._emb_count % self.max_embeddings] = vec
+        self._emb_count += 1
+
     # ---------------- Public API -----------------
     def is_duplicate(
         self, article: Article, *, prior_titles: Iterable[str] = ()
@@ -132,36 +399,47 @@ class Deduplicator:
             return True, "hash"
 
         # Fuzzy title match against provided titles and persisted titles
-        for t in list(prior_titles) + self._titles:
-            if self.similar_titles(article.title, t) >= self.title_threshold:
-                return True, "title"
+        if self._matches_title(article.title, prior_titles):
+            return True, "title"
 
-        # Semantic similarity (in-memory, only this run)
-        if self.enable_semantic and _np is not None and article.raw_text:
-            vec = self._embed(article.raw_text[:8000])  # limit very long texts
-            if vec is not None and self._embeddings:
-                max_sim = self._max_cosine(vec)
-                if max_sim >= self.semantic_threshold:
-                    return True, "semantic"
+        # Semantic similarity (in-memory, only this run); the costliest check, so
+        # it runs last and only once there are kept vectors to compare against
+        if self._emb_count and self._semantic_active() and article.raw_text:
+            vec = self._article_embedding(article)
+            if vec is not None and self._max_cosine(vec) >= self.semantic_threshold:
+                return True, "semantic"
         return False, None
 
-    def mark_seen(self, article: Article) -> None:
+    def mark_seen(self, article: Article, *, persist: bool = True) -> None:
+        """Remember ``article`` for the checks that follow.
+
+        With ``persist=False`` it is only known to this run until
+        ``persist_seen()`` writes it to the store, e.g. once its issue exists.
+        """
         content_hash = self.content_hash(article.title, article.raw_text)
         self._seen_hashes.add(content_hash)
         # Track titles for future fuzzy matching
-        if article.title:
-            self._titles.append(article.title.strip())
+        title = article.title.strip() if article.title else None
+        if title is not None:
+            self._titles.append(title)
+            self._index_title(self._titles[-1])
             # keep reasonable memory footprint
             if len(self._titles) > 10000:
+                for t in self._titles[:-10000]:
+                    self._unindex_title(t)
                 self._titles = self._titles[-10000:]
         # Track embedding in-memory only
-        if self.enable_semantic and article.raw_text:
-            vec = self._embed(article.raw_text[:8000])
+        if self._semantic_active() and article.raw_text:
+            vec = self._article_embedding(article)
             if vec is not None:
-                self._embeddings.append(vec)
-                if len(self._embeddings) > self.max_embeddings:
-                    self._embeddings = self._embeddings[-self.max_embeddings :]
-        self._save()
+                self._remember_embedding(vec)
+        if persist:
+            self._persist(content_hash, title)
+
+    def persist_seen(self, article: Article) -> None:
+        """Store an article passed to ``mark_seen(persist=False)`` for later runs."""
+        title = article.title.strip() if article.title else None
+        self._persist(self.content_hash(article.title, article.raw_text), title)
 
 
 @dataclass(slots=True)
@@ -185,19 +463,21 @@ def remove_duplicates(
     returns a tuple of (unique_articles, DedupStats).
     """
     d = dedup or Deduplicator()
+    articles = list(articles)
+    d.prefetch_embeddings(articles)
     unique: List[Article] = []
     reasons = defaultdict(int)
+    # Only the caller's titles: mark_seen() already indexes each kept title, and
+    # growing this list would have every check re-lowercase all titles kept so far
     prior_list = list(prior_titles)
-    total = 0
-    for art in articles:
-        total += 1
-        is_dup, reason = d.is_duplicate(art, prior_titles=prior_list)
-        if is_dup:
-            reasons[(reason or "unknown")] += 1
-            continue
-        d.mark_seen(art)
-        if art.title:
-            prior_list.append(art.title)
-        unique.append(art)
+    total = len(articles)
+    with d.batch_writes():
+        for art in articles:
+            is_dup, reason = d.is_duplicate(art, prior_titles=prior_list)
+            if is_dup:
+                reasons[(reason or "unknown")] += 1
+                continue
+            d.mark_seen(art)
+            unique.append(art)
     stats = DedupStats(total=total, kept=len(unique), duplicates=total - len(unique), reasons=dict(reasons))
     return (unique, stats) if return_stats else unique
@@ -1,9 +1,22 @@
 from __future__ import annotations
 
 import re
-from typing import List
+from typing import Iterator, List
 
 from .ai import AIClient, create_ai_client
+from .result_cache import call_key, get_result_cache
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_BULLET_MARKER_RE = re.compile(r"^[-•]\s*")
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Lazy ``_SENTENCE_SPLIT_RE.split(text)``, so callers can stop early."""
+    start = 0
+    for m in _SENTENCE_SPLIT_RE.finditer(text):
+        yield text[start : m.start()]
+        start = m.end()
+    yield text[start:]
 
 
 def _truncate_words(text: str, max_words: int) -> str:
@@ -31,27 +44,38 @@ def generate_impact_points(
     if ai is None:
         ai = create_ai_client()
 
+    cache = get_result_cache()
+    key = None
+    if cache is not None:
+        key = call_key("impact", ai, text, max_points, max_words_per_bullet)
+        cached = cache.get_value(key)
+        if isinstance(cached, list) and cached:
+            return cached
+
     prompt = _build_bullets_prompt(text, max_points=max_points, max_words_per_bullet=max_words_per_bullet)
     try:
         raw = ai.summarize(prompt, max_words=max_points * max_words_per_bullet)
         lines = [ln.strip() for ln in raw.splitlines() if ln.strip()]
         bullets: List[str] = []
         for ln in lines:
-            ln = re.sub(r"^[-•]\s*", "", ln)  # strip leading markers
+            ln = _BULLET_MARKER_RE.sub("", ln)  # strip leading markers
             bullets.append(_truncate_words(ln, max_words_per_bullet))
             if len(bullets) >= max_points:
                 break
         if bullets:
+            if key:  # only model output is cached, never the heuristic below
+                cache.put_value(key, bullets)
             return bullets
     except Exception:
         pass
 
-    # Fallback heuristic if AI fails
-    sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if s.strip()]
+    # Fallback heuristic if AI fails; sentences are split only as far as needed
     points: List[str] = []
-    for s in sentences:
+    for s in map(str.strip, _iter_sentences(text)):
         if len(points) >= max_points:
             break
+        if not s:
+            continue
         if len(s.split()) >= 6:
             points.append(_truncate_words(s, max_words_per_bullet))
     if not points:
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import atexit
 import html
+import multiprocessing
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 import unicodedata
 from dataclasses import replace
 
@@ -16,7 +21,6 @@ except Exception:  # pragma: no cover - optional dependency
     chardet = None  # type: ignore
 
 _whitespace_re = re.compile(r"\s+")
-_control_chars_re = re.compile(r"[\u0000-\u0008\u000B\u000C\u000E-\u001F\u007F]")
 
 _PUNCT_TRANSLATION = {
     ord("\u2018"): "'",  # left single quote
@@ -27,6 +31,10 @@ _PUNCT_TRANSLATION = {
     ord("\u2014"): "-",  # em dash
     ord("\u00A0"): " ",  # non-breaking space
 }
+# Control chars (except tab/LF/CR) become spaces in the same pass. NFKC never
+# produces them, so mapping them before normalization gives the same result.
+_CONTROL_TO_SPACE = {cp: " " for cp in (*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F)}
+_NORMALIZE_TRANSLATION = {**_PUNCT_TRANSLATION, **_CONTROL_TO_SPACE}
 
 _logger = get_logger("ja.processors.normalize")
 
@@ -54,6 +62,11 @@ def clean_html_to_text(raw_html: str | None) -> str:
         else:
             raw_html = raw_html.decode("utf-8", errors="replace")  # type: ignore[assignment]
 
+    # Plain text (already-extracted HTTP pages, re-cleaned text) has nothing for
+    # the parser to strip or decode; skipping it gives the same result
+    if "<" not in raw_html and "&" not in raw_html:
+        return _whitespace_re.sub(" ", raw_html).strip()
+
     soup = BeautifulSoup(raw_html, "html.parser")
     text = soup.get_text("\n")
     text = html.unescape(text)
@@ -77,16 +90,15 @@ def normalize_plain_text(text: str | None) -> str:
     if text.startswith("\ufeff"):
         text = text.lstrip("\ufeff")
 
-    # Punctuation normalization and unicode compatibility normalization
-    text = text.translate(_PUNCT_TRANSLATION)
-    text = unicodedata.normalize("NFKC", text)
-
-    # Remove remaining control chars (preserve nothing special as newlines are collapsed later)
-    text = _control_chars_re.sub(" ", text)
+    # Punctuation and control chars in one pass, then unicode compatibility
+    # normalization. The order matters: NFKC can yield dashes (e.g. U+FE31) that
+    # were never translated, and those are kept as they are.
+    text = text.translate(_NORMALIZE_TRANSLATION)
+    if not text.isascii():  # NFKC leaves ASCII unchanged
+        text = unicodedata.normalize("NFKC", text)
 
-    # Collapse whitespace and trim
-    text = _whitespace_re.sub(" ", text).strip()
-    return text
+    # Collapse whitespace and trim (str.split matches the same chars as \s)
+    return " ".join(text.split())
 
 
 def normalize_article(article: "Article") -> "Article":  # quoted type to avoid import cycle at import time
@@ -119,12 +131,93 @@ def normalize_article(article: "Article") -> "Article":  # quoted type to avoid
         return article
 
 
+# HTML cleaning is CPU bound, so large batches can be spread over processes;
+# smaller ones are not worth the pickling round-trip
+_PARALLEL_MIN_BATCH = 32
+# Opt-in via NORMALIZE_WORKERS; capped so a big host does not start dozens of workers
+_MAX_POOL_WORKERS = 8
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+def _usable_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):  # not available on every platform
+        return os.cpu_count() or 1
+
+
+def _process_pool() -> Optional[ProcessPoolExecutor]:
+    """Shared worker pool, started on first use; None unless NORMALIZE_WORKERS > 1."""
+    global _POOL, _POOL_WORKERS
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                try:
+                    workers = int(os.getenv("NORMALIZE_WORKERS") or 1)
+                except ValueError:
+                    workers = 1
+                workers = min(workers, _usable_cpus(), _MAX_POOL_WORKERS)
+                if workers <= 1:
+                    return None
+                # Fetch threads are running when batches arrive, and forking a
+                # threaded process can copy held locks, so workers come from a server
+                methods = multiprocessing.get_all_start_methods()
+                method = "forkserver" if "forkserver" in methods else "spawn"
+                ctx = multiprocessing.get_context(method)
+                _POOL = ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+                _POOL_WORKERS = workers
+    return _POOL
+
+
+def shutdown_process_pool() -> None:
+    """Stop the shared worker pool, if one was started."""
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        pool, _POOL, _POOL_WORKERS = _POOL, None, 0
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_process_pool)
+
+
+def _normalize_or_error(article: "Article") -> Tuple[Optional["Article"], Optional[str]]:
+    try:
+        return normalize_article(article), None
+    except Exception as exc:  # noqa: BLE001 - reported by the parent
+        return None, str(exc)
+
+
 def batch_normalize(articles: Iterable["Article"]) -> List["Article"]:
     """Normalize a list of articles defensively.
 
-    Any article that fails normalization is skipped with a warning.
+    Any article that fails normalization is skipped with a warning. With
+    ``NORMALIZE_WORKERS`` above 1, batches of ``_PARALLEL_MIN_BATCH`` or more
+    are normalized in a process pool.
     """
-    normalized: List["Article"] = []
+    articles = list(articles)
+    pool = _process_pool() if len(articles) >= _PARALLEL_MIN_BATCH else None
+    if pool is not None:
+        try:
+            # About four chunks per worker: few round-trips, still balanced
+            chunksize = max(1, len(articles) // (4 * _POOL_WORKERS))
+            results = list(pool.map(_normalize_or_error, articles, chunksize=chunksize))
+        except Exception as exc:  # noqa: BLE001 - e.g. a broken pool; redo it inline
+            _logger.warning("Parallel normalization failed: %s; normalizing inline", exc)
+        else:
+            normalized: List["Article"] = []
+            for a, (result, error) in zip(articles, results):
+                if result is None:
+                    _logger.warning(
+                        "Failed to normalize article '%s': %s", getattr(a, "title", "?"), error
+                    )
+                else:
+                    normalized.append(result)
+            return normalized
+
+    normalized = []
     for a in articles:
         try:
             normalized.append(normalize_article(a))
@@ -0,0 +1,162 @@
+"""On-disk cache of model results keyed by article content.
+
+Feeds re-publish the same items and CI re-runs reprocess everything, so the
+classification, summary and impact points of an article are stored under a
+hash of its normalized text plus the active backend/model. A hit skips all
+three model calls. Individual classify/summarize calls are cached in the
+same store, keyed by the client that served them, for callers outside the
+orchestrator.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger("ja.processors.result_cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL
+)
+"""
+
+# Bump when the cached fields or the prompts behind them change
+_CACHE_VERSION = 1
+_MAX_AGE_S = 30 * 86400
+
+# Mirrors the defaults of the AI clients so a model switch invalidates entries
+_MODEL_ENV = {
+    "ollama": ("OLLAMA_MODEL", "llama3.1:8b-instruct"),
+    "gemini": ("GEMINI_MODEL", "gemini-1.5-flash"),
+}
+
+
+@dataclass(slots=True)
+class CachedResult:
+    category: str
+    confidence: float
+    summary: str
+    impact_points: List[str]
+
+
+def result_key(text: str) -> str:
+    """Cache key for ``text`` under the currently configured backend and model."""
+    backend = os.environ.get("PROCESSING_BACKEND", "ollama").lower()
+    env, default = _MODEL_ENV.get(backend, ("", ""))
+    model = os.environ.get(env, default) if env else ""
+    h = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"v{_CACHE_VERSION}:{backend}:{model}:{h}"
+
+
+def call_key(kind: str, ai: object, text: str, *params: object) -> str:
+    """Cache key for one ``kind`` call of client ``ai`` on ``text`` with ``params``."""
+    h = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    extra = ":".join(str(p) for p in params)
+    model = getattr(ai, "model", "")
+    return f"v{_CACHE_VERSION}:{kind}:{type(ai).__name__}:{model}:{extra}:{h}"
+
+
+class ResultCache:
+    """SQLite-backed store shared by the article worker threads of one process."""
+
+    def __init__(self, path: Path | str, *, max_age_s: float = _MAX_AGE_S) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age_s = max_age_s
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get_value(self, key: str) -> Any:
+        """Stored JSON value for ``key``, or None if missing, expired or unreadable."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, stored_at FROM results WHERE key = ?", (key,)
+                ).fetchone()
+            if not row or time.time() - row[1] > self.max_age_s:
+                return None
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as exc:
+            logger.debug("Result cache lookup failed: %s", exc)
+            return None
+
+    def put_value(self, key: str, value: Any) -> None:
+        try:
+            encoded = json.dumps(value, ensure_ascii=False)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (key, value, stored_at) VALUES (?, ?, ?)",
+                    (key, encoded, time.time()),
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as exc:
+            logger.debug("Failed to cache result: %s", exc)
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        data = self.get_value(key)
+        if data is None:
+            return None
+        try:
+            return CachedResult(
+                category=data["category"],
+                confidence=float(data["confidence"]),
+                summary=data["summary"],
+                impact_points=list(data["impact_points"]),
+            )
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.debug("Malformed cached result for %s: %s", key, exc)
+            return None
+
+    def put(self, key: str, result: CachedResult) -> None:
+        self.put_value(
+            key,
+            {
+                "category": result.category,
+                "confidence": result.confidence,
+                "summary": result.summary,
+                "impact_points": result.impact_points,
+            },
+        )
+
+
+def open_result_cache() -> Optional[ResultCache]:
+    """Open the cache at ``RESULT_CACHE_PATH``; an empty value disables it."""
+    path = os.getenv("RESULT_CACHE_PATH", ".cache/results.sqlite3")
+    if not path:
+        return None
+    try:
+        return ResultCache(path)
+    except Exception as exc:  # noqa: BLE001 - caching is best effort
+        logger.debug("Result cache unavailable: %s", exc)
+        return None
+
+
+_CACHE: Optional[ResultCache] = None
+_CACHE_LOCK = threading.Lock()
+_CACHE_OPENED = False
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Process-wide cache, opened on first use; None if disabled or unavailable."""
+    global _CACHE, _CACHE_OPENED
+    if _CACHE_OPENED:
+        return _CACHE
+    with _CACHE_LOCK:
+        if not _CACHE_OPENED:
+            _CACHE = open_result_cache()
+            _CACHE_OPENED = True
+    return _CACHE
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 import os
+import re
+from typing import List, Optional, Sequence
 
 from .ai import AIClient, create_ai_client
+from .ai.batch import map_texts
 from .ai.retry import summarize_with_retry
+from .result_cache import call_key, get_result_cache
 from ..utils.logging import get_logger
 
 logger = get_logger("ja.processors.summarize")
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_CLAUSE_SPLIT_RE = re.compile(r"[;:,]\s+")
+
 
 def _truncate_words(text: str, max_words: int) -> str:
-    words = text.split()
+    # n words take at least 2n-1 characters, so shorter texts are within the limit
+    if len(text) <= 2 * max_words:
+        return text
+    # maxsplit leaves the tail as one string; a leftover element means it was longer
+    words = text.split(None, max_words)
     return " ".join(words[:max_words]) if len(words) > max_words else text
 
 
@@ -35,6 +46,14 @@ def summarize_text(text: str, *, ai: AIClient | None = None, max_words: int = 15
 
     # Chunk long content to improve summary quality and avoid context overflow
     MAX_WORDS_PER_CHUNK = int(os.getenv("AI_SUMMARY_CHUNK_WORDS", "300"))
+    cache = get_result_cache()
+    key = None
+    if cache is not None:
+        key = call_key("summarize", ai, text, max_words, MAX_WORDS_PER_CHUNK)
+        cached = cache.get_value(key)
+        if isinstance(cached, str):
+            return cached
+
     words = text.split()
     if len(words) > MAX_WORDS_PER_CHUNK * 2:
         chunk_texts = _split_into_word_chunks(text, max_words_per_chunk=MAX_WORDS_PER_CHUNK)
@@ -49,16 +68,37 @@ def summarize_text(text: str, *, ai: AIClient | None = None, max_words: int = 15
         summary = summarize_with_retry(ai, text, max_words=max_words).strip()
 
     # Normalize to 2-3 sentences and enforce word limit
-    import re
-
-    sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", summary) if s.strip()]
+    sentences = [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(summary)) if s]
     if len(sentences) == 1:
         # best-effort split on semicolons/commas if single long sentence
-        parts = re.split(r"[;:,]\s+", sentences[0])
-        sentences = [p.strip() for p in parts if p.strip()][:3]
+        parts = _CLAUSE_SPLIT_RE.split(sentences[0])
+        sentences = [p for p in map(str.strip, parts) if p][:3]
     sentences = sentences[:3]
-    if len(sentences) < 2 and len(text.split()) > 40:
+    # maxsplit: only whether the source has more than 40 words matters
+    if len(sentences) < 2 and len(text.split(None, 41)) > 40:
         # ensure at least two sentences when source is non-trivial
         sentences = sentences + [""]
-    out = " ".join(sentences).strip()
-    return _truncate_words(out, max_words)
+    out = _truncate_words(" ".join(sentences).strip(), max_words)
+    if key:
+        cache.put_value(key, out)
+    return out
+
+
+def summarize_texts(
+    texts: Sequence[str],
+    *,
+    ai: AIClient | None = None,
+    max_words: int = 150,
+    default: Optional[str] = None,
+) -> List[str]:
+    """Summarize several texts through one client, overlapping the backend calls.
+
+    Results keep input order. See ``map_texts`` for concurrency and ``default``.
+    """
+    ai = ai or create_ai_client()
+    return map_texts(
+        lambda t: summarize_text(t, ai=ai, max_words=max_words),
+        texts,
+        default=default,
+        what="Summarization",
+    )
@@ -8,6 +8,11 @@ import yaml
 
 from ..models import Source
 
+try:  # pragma: no cover - libyaml bindings are optional
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:  # pragma: no cover - PyYAML built without libyaml
+    _YamlLoader = yaml.SafeLoader
+
 
 class ConfigError(Exception):
     """Raised when the configuration file is invalid or missing required fields."""
@@ -18,11 +23,12 @@ REQUIRED_FIELDS = {"name", "url", "type"}
 # Accepted categories used across the pipeline. These map to
 # analysis and classification outputs. Kept here for lightweight
 # validation of configuration files to catch typos early.
-ALLOWED_CATEGORIES = {"Agile", "DevOps", "Architecture/Infra", "Leadership"}
+ALLOWED_CATEGORIES = frozenset({"Agile", "DevOps", "Architecture/Infra", "Leadership"})
+_ALLOWED_SORTED = sorted(ALLOWED_CATEGORIES)
 
 
-def _validate_source_dict(entry: dict) -> None:
-    """Validate a single source mapping from YAML.
+def _build_source(entry: dict) -> Source:
+    """Validate a single source mapping from YAML and build its ``Source``.
 
     Required fields: name (str), url (http/https), type ('rss' | 'http').
     Optional fields:
@@ -30,13 +36,16 @@ def _validate_source_dict(entry: dict) -> None:
       - category_hints: list[str] from ALLOWED_CATEGORIES
       - headers: mapping[str, str] (for HTTP sources)
     """
-    missing = REQUIRED_FIELDS - set(entry)
+    if not isinstance(entry, dict):
+        raise ConfigError(f"Each source must be a mapping, got: {type(entry)}")
+    missing = REQUIRED_FIELDS - entry.keys()
     if missing:
         raise ConfigError(f"Missing required fields: {sorted(missing)} in {entry}")
 
     # type
-    if entry["type"] not in {"rss", "http"}:
-        raise ConfigError(f"Invalid type '{entry['type']}'. Must be 'rss' or 'http'.")
+    type_ = entry["type"]
+    if type_ not in {"rss", "http"}:
+        raise ConfigError(f"Invalid type '{type_}'. Must be 'rss' or 'http'.")
 
     # url
     url_str = str(entry["url"]).strip()
@@ -45,42 +54,40 @@ def _validate_source_dict(entry: dict) -> None:
         raise ConfigError(f"Invalid URL '{url_str}'. Must be absolute http(s) URL.")
 
     # keywords
-    if "keywords" in entry and entry["keywords"] is not None:
-        kws = entry["keywords"]
-        if not isinstance(kws, list) or not all(isinstance(k, (str, bytes)) for k in kws):
-            raise ConfigError("'keywords' must be a list of strings if provided")
+    kws = entry.get("keywords")
+    if kws is not None and (
+        not isinstance(kws, list) or not all(isinstance(k, (str, bytes)) for k in kws)
+    ):
+        raise ConfigError("'keywords' must be a list of strings if provided")
 
     # category_hints
-    if "category_hints" in entry and entry["category_hints"] is not None:
-        hints = entry["category_hints"]
+    hints = entry.get("category_hints")
+    if hints is not None:
         if not isinstance(hints, list) or not all(isinstance(c, (str, bytes)) for c in hints):
             raise ConfigError("'category_hints' must be a list of strings if provided")
-        invalid = [str(c) for c in hints if str(c) not in ALLOWED_CATEGORIES]
+        invalid = set(map(str, hints)) - ALLOWED_CATEGORIES
         if invalid:
             raise ConfigError(
                 "Invalid category_hints: "
-                + ", ".join(sorted(set(invalid)))
-                + f". Allowed: {sorted(ALLOWED_CATEGORIES)}"
+                + ", ".join(sorted(invalid))
+                + f". Allowed: {_ALLOWED_SORTED}"
             )
 
     # headers
-    if "headers" in entry and entry["headers"] is not None:
-        headers = entry["headers"]
-        if not isinstance(headers, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in headers.items()):
-            raise ConfigError("'headers' must be a mapping of string keys to string values if provided")
-
+    headers = entry.get("headers")
+    if headers is not None and (
+        not isinstance(headers, dict)
+        or not all(isinstance(k, str) and isinstance(v, str) for k, v in headers.items())
+    ):
+        raise ConfigError("'headers' must be a mapping of string keys to string values if provided")
 
-def _coerce_source(entry: dict) -> Source:
-    keywords = entry.get("keywords") or []
-    category_hints = entry.get("category_hints") or []
-    headers = entry.get("headers") or {}
     return Source(
         name=str(entry["name"]).strip(),
-        url=str(entry["url"]).strip(),
-        type=str(entry["type"]).strip(),
-        keywords=[str(k).strip() for k in keywords],
-        category_hints=[str(c).strip() for c in category_hints],
-        headers={str(k): str(v) for k, v in headers.items()},
+        url=url_str,
+        type=type_,
+        keywords=[str(k).strip() for k in kws or ()],
+        category_hints=[str(c).strip() for c in hints or ()],
+        headers=dict(headers) if headers else {},
     )
 
 
@@ -104,16 +111,10 @@ def load_sources_config(path: Path | str) -> List[Source]:
         raise ConfigError(f"Config file not found: {config_path}")
 
     with config_path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YamlLoader) or {}  # safe_load, with libyaml when present
 
     sources_raw: Iterable[dict] = (data.get("sources") or [])
     if not isinstance(sources_raw, list):
         raise ConfigError("'sources' must be a list in the YAML configuration")
 
-    sources: List[Source] = []
-    for item in sources_raw:
-        if not isinstance(item, dict):
-            raise ConfigError(f"Each source must be a mapping, got: {type(item)}")
-        _validate_source_dict(item)
-        sources.append(_coerce_source(item))
-    return sources
+    return [_build_source(item) for item in sources_raw]
@@ -0,0 +1,30 @@
+"""JSON encode/decode helpers.
+
+Uses ``orjson`` (C implementation) when installed and falls back to the
+standard library otherwise. Output is always UTF-8 bytes without ASCII
+escaping, matching ``json.dumps(..., ensure_ascii=False)``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import orjson as _orjson  # type: ignore
+except Exception:  # pragma: no cover - env without orjson
+    _orjson = None  # type: ignore
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes (2-space indented if ``indent``)."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
@@ -6,16 +6,24 @@ format suitable for both local development and containerized environments.
 
 from __future__ import annotations
 
+import atexit
+import copy
+import functools
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
-from typing import Literal, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, WatchedFileHandler
+from typing import List, Literal, Optional, Tuple
+
+from . import jsonio
 
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 LOG_OUTPUT = os.environ.get("LOG_OUTPUT", "file").lower()
 LOG_FILE_PATH = os.environ.get("LOG_FILE_PATH", "logs/podcast-agent.log")
 LOG_FORMAT = os.environ.get("LOG_FORMAT", "text").lower()
+# "external" leaves rotation to logrotate and reopens the file when it is moved
+LOG_ROTATE = os.environ.get("LOG_ROTATE", "internal").lower()
 K8S_CLUSTER = os.environ.get("K8S_CLUSTER")
 KUBERNETES_SERVICE_HOST = os.environ.get("KUBERNETES_SERVICE_HOST")
 
@@ -23,8 +31,107 @@ LogOutput = Literal["stdout", "file", "both"]
 LogFormat = Literal["text", "json"]
 
 
+class _JsonFormatter(logging.Formatter):
+    """One JSON object per record, with the message and traceback properly escaped."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "name": record.name,
+            "file": f"{record.filename}:{record.lineno}",
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return jsonio.dumps(entry).decode("utf-8")
+
+
+class _QueueHandler(QueueHandler):
+    """Queue records for the listener thread, formatting their args right away.
+
+    The queue stays in-process, so ``exc_info`` is kept for the output
+    formatter instead of being flattened into the message as the base class does.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _RotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that formats each record once and tracks the file size in bytes.
+
+    The base class stats the path, seeks, tells and formats the record on every
+    emit just to decide on rollover, then formats it again to write it. Here the
+    size is read once per opened file and advanced by what this handler writes,
+    so other writers to the same file are not accounted for.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._size = 0
+        self._regular = True
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        stream = super()._open()
+        stream.seek(0, 2)
+        self._size = stream.tell()
+        # See bpo-45401: never roll over anything other than regular files
+        self._regular = os.path.isfile(self.baseFilename)
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:  # delay was set...
+                self.stream = self._open()
+            # maxBytes counts bytes, and non-ASCII text encodes to more than one per char
+            size = len(msg) if msg.isascii() else len(msg.encode(self.stream.encoding, "replace"))
+            if self.maxBytes > 0 and self._regular and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Writes happen on this listener's thread; replaced by each configure_logging()
+_LISTENER: Optional[QueueListener] = None
+# Handler settings and root handler of the last configuration, to skip no-op rebuilds
+_LAST_APPLIED: Optional[Tuple[tuple, logging.Handler]] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and close the handlers of the current listener."""
+    global _LISTENER
+    listener, _LISTENER = _LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(_stop_listener)
+
+
+@functools.lru_cache(maxsize=1)
 def is_kubernetes_env() -> bool:
-    """Check if the application is running in a Kubernetes environment."""
+    """Check if the application is running in a Kubernetes environment.
+
+    Depends only on import-time values and the service account mount, so the
+    answer is computed once per process.
+    """
     return bool(K8S_CLUSTER or KUBERNETES_SERVICE_HOST or os.path.exists("/var/run/secrets/kubernetes.io/serviceaccount"))
 
 
@@ -64,32 +171,62 @@ def configure_logging(
     if file_path is None:
         file_path = os.environ.get("LOG_FILE_PATH") or LOG_FILE_PATH
 
+    global _LISTENER, _LAST_APPLIED
+    # Neither format shows thread or process fields; skip collecting them per record
+    # (filename/lineno are shown, so the caller lookup stays on)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
+    if module:
+        logging.getLogger(module).setLevel(level)
+
+    # Same outputs and format as last time (and nobody replaced the handler):
+    # keep the open log file and listener instead of tearing them down
+    key = (output, file_path, log_format, os.environ.get("LOG_ROTATE"), sys.stdout)
+    if _LAST_APPLIED is not None and _LAST_APPLIED[0] == key:
+        if root_logger.handlers == [_LAST_APPLIED[1]]:
+            return
+    _LAST_APPLIED = None
     root_logger.handlers.clear()
+    _stop_listener()
+    handlers: List[logging.Handler] = []
 
     formatter = (
         logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(filename)s:%(lineno)d | %(message)s")
         if log_format == "text"
-        else logging.Formatter('{"timestamp": "%(asctime)s", "level": "%(levelname)s", "name": "%(name)s", "file": "%(filename)s:%(lineno)d", "message": "%(message)s"}')
+        else _JsonFormatter()
     )
 
     if output in ["stdout", "both"]:
         stdout_handler = logging.StreamHandler(sys.stdout)
         stdout_handler.setFormatter(formatter)
-        root_logger.addHandler(stdout_handler)
+        handlers.append(stdout_handler)
 
     if output in ["file", "both"]:
         log_dir = os.path.dirname(file_path)
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        file_handler = RotatingFileHandler(file_path, maxBytes=10 * 1024 * 1024, backupCount=5)
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        if log_dir:  # a bare file name logs to the working directory
+            os.makedirs(log_dir, exist_ok=True)
 
-    if module:
-        logging.getLogger(module).setLevel(level)
+        if (os.environ.get("LOG_ROTATE") or LOG_ROTATE).lower() == "external":
+            file_handler: logging.Handler = WatchedFileHandler(file_path)
+        else:
+            file_handler = _RotatingFileHandler(
+                file_path, maxBytes=10 * 1024 * 1024, backupCount=5
+            )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    if handlers:
+        # Logging threads only enqueue; the listener does the writes and rotation
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _LISTENER = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _LISTENER.start()
+        queue_handler = _QueueHandler(log_queue)
+        root_logger.addHandler(queue_handler)
+        _LAST_APPLIED = (key, queue_handler)
 
 
 def get_logger(name: str) -> logging.Logger:
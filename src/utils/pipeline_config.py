@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
+# Defaults are read from the environment per instance, not once at import
 @dataclass(slots=True)
 class PipelineConfig:
-    horizon_weeks: int = int(os.getenv("PIPELINE_HORIZON_WEEKS", "4"))
-    min_score: float = float(os.getenv("PIPELINE_MIN_SCORE", "0.7"))
-    group_max_items: int = int(os.getenv("PIPELINE_GROUP_MAX_ITEMS", "4"))
-    default_assignees_csv: str = os.getenv("PIPELINE_DEFAULT_ASSIGNEES", "")
+    horizon_weeks: int = field(
+        default_factory=lambda: int(os.getenv("PIPELINE_HORIZON_WEEKS", "4"))
+    )
+    min_score: float = field(
+        default_factory=lambda: float(os.getenv("PIPELINE_MIN_SCORE", "0.7"))
+    )
+    group_max_items: int = field(
+        default_factory=lambda: int(os.getenv("PIPELINE_GROUP_MAX_ITEMS", "4"))
+    )
+    default_assignees_csv: str = field(
+        default_factory=lambda: os.getenv("PIPELINE_DEFAULT_ASSIGNEES", "")
+    )
 
     @property
     def default_assignees(self) -> list[str]: